@@ -125,6 +125,7 @@ from aiohttpx._api import (
 )
 
 from aiohttpx.client import Client, ClientParams
+from aiohttpx.utils.loops import install_event_loop_policy
 
 from aiohttpx.schemas.proxies import ProxyManager, ProxyRegion, ProxyEndpoint
 from aiohttpx.proxy import ProxyClient
@@ -2,33 +2,82 @@ from __future__ import annotations
 
 import httpx
 import typing
-from contextlib import asynccontextmanager, contextmanager, suppress
-from aiohttpx.utils import logger
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from httpx._client import USE_CLIENT_DEFAULT
+from importlib.util import find_spec
+# Referenced through the module, so the logger is only created once used
+from aiohttpx.utils import logs
+from aiohttpx.utils.logs import mute_httpx_logger
 from aiohttpx.utils.lazy import get_aiohttpx_settings
 from aiohttpx.utils.helpers import is_coro_func
-from aiohttpx.imports.classprops import lazyproperty
-from aiohttpx.imports.soup import (
-    BeautifulSoup,
-    resolve_bs4,
-)
+from aiohttpx.utils.dns import DNSCache, get_dns_cache, install_dns_cache
+from aiohttpx.utils.pool import get_pool_key, acquire_shared_transport, acquire_async_shared_transport
+from aiohttpx.utils.cache import ResponseCache
+from aiohttpx.imports.classprops import cachedproperty
+from aiohttpx.imports import h2 as _h2
 from aiohttpx.schemas.params import ClientParams
 from aiohttpx.schemas import types as httpxType
 
 if typing.TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
     from aiohttpx.configs.base import AiohttpxSettings
 
 # Monkey patching httpx.Response to add soup property
 # that way it is only called when the property is accessed
 # rather than on every request
 
-@lazyproperty
+# bs4 is only imported on the first `soup` access
+_BeautifulSoup: typing.Optional[typing.Type['BeautifulSoup']] = None
+_soup_parser: typing.Optional[str] = None
+
+def _load_soup() -> typing.Type['BeautifulSoup']:
+    """
+    Imports `BeautifulSoup`, caching it once `bs4` is available
+    """
+    global _BeautifulSoup, _soup_parser
+    from aiohttpx.imports import soup
+    soup.resolve_bs4(required = False)
+    if soup._bs4_available:
+        _BeautifulSoup, _soup_parser = soup.BeautifulSoup, soup.get_soup_parser()
+    return soup.BeautifulSoup
+
+@cachedproperty
 def soup_property(self: 'httpx.Response'):
-    resolve_bs4(required = False)
+    bs = _BeautifulSoup if _BeautifulSoup is not None else _load_soup()
     with suppress(Exception):
-        return BeautifulSoup(self.text, 'html.parser')
+        return bs(
+            self.content, 
+            _soup_parser, 
+            from_encoding = self.charset_encoding,
+            parse_only = getattr(self, '_soup_strainer', None),
+        )
 
-def wrap_soup_response(response: httpx.Response) -> httpx.Response:
-    setattr(response.__class__, 'soup', soup_property)
+_soup_patched = False
+
+def _patch_soup() -> None:
+    """
+    Adds the `soup` property to `httpx.Response` once
+    """
+    global _soup_patched
+    if not hasattr(httpx.Response, 'soup'):
+        httpx.Response.soup = soup_property
+        # Cache the parsed soup under `soup` so it shadows the descriptor
+        soup_property.__set_name__(httpx.Response, 'soup')
+    _soup_patched = True
+
+if find_spec('bs4') is not None:
+    _patch_soup()
+
+def wrap_soup_response(
+    response: httpx.Response, 
+    strainer: typing.Optional['SoupStrainer'] = None,
+) -> httpx.Response:
+    # The class is only patched here if bs4 was missing at import
+    if not _soup_patched: _patch_soup()
+    if strainer is not None: response._soup_strainer = strainer
     return response
 
 def raise_for_status(self: 'httpx.Response') -> None:
@@ -73,6 +122,211 @@ def raise_for_status(self: 'httpx.Response') -> None:
 
 httpx.Response.raise_for_status = raise_for_status
 
+# A `(method, url)` or `(method, url, kwargs)` request for the bulk methods
+BulkRequest = typing.Union[
+    typing.Tuple[str, httpxType.URLTypes],
+    typing.Tuple[str, httpxType.URLTypes, typing.Dict[str, typing.Any]],
+]
+
+# The number of requests in flight for the bulk methods
+_DEFAULT_CONCURRENCY = 32
+
+def _validate_concurrency(concurrency: int) -> None:
+    """
+    Rejects limits that would never send a request
+    """
+    if concurrency < 1:
+        raise ValueError(f"`concurrency` must be at least 1, got {concurrency}")
+
+_PROXIED_ATTRS = frozenset({'base_url', 'headers', 'params', 'cookies', 'auth', 'timeout', 'event_hooks'})
+_DICT_ATTRS = frozenset({'headers', 'params', 'cookies'})
+
+@functools.lru_cache(maxsize = 1024)
+def _parse_url(url: str) -> httpx.URL:
+    """
+    Parses the url once for repeated targets, as `httpx.URL` is immutable
+    """
+    return httpx.URL(url)
+
+def _logged_request(
+    request: typing.Callable[..., httpx.Response], 
+    log: typing.Callable[..., None],
+) -> typing.Callable[..., httpx.Response]:
+    """
+    Wraps the client's `request` to log each request in debug mode
+    """
+    def logged_request(method: str, url: httpxType.URLTypes, **kwargs) -> httpx.Response:
+        log(method, url, kwargs.get('headers'), kwargs.get('params'))
+        return request(method, url, **kwargs)
+    return logged_request
+
+def _async_logged_request(
+    request: typing.Callable[..., typing.Awaitable[httpx.Response]], 
+    log: typing.Callable[..., None],
+) -> typing.Callable[..., typing.Awaitable[httpx.Response]]:
+    """
+    Wraps the async client's `request` to log each request in debug mode
+    """
+    async def logged_request(method: str, url: httpxType.URLTypes, **kwargs) -> httpx.Response:
+        log(method, url, kwargs.get('headers'), kwargs.get('params'))
+        return await request(method, url, **kwargs)
+    return logged_request
+
+def _noop(*args, **kwargs) -> None:
+    pass
+
+async def _async_noop(*args, **kwargs) -> None:
+    pass
+
+def _verb(method: str) -> typing.Callable[..., httpx.Response]:
+    """
+    Creates the `<method>` shortcut for `Client.request`
+    """
+    def verb(self: 'Client', url: httpxType.URLTypes, **kwargs) -> httpx.Response:
+        return self.request(method, url, **kwargs)
+
+    verb.__name__ = method.lower()
+    verb.__qualname__ = f'Client.{verb.__name__}'
+    verb.__doc__ = f"""
+        Send {'an' if method[0] in 'AEIOU' else 'a'} `{method}` request.
+
+        **Parameters**: See `httpx.request`.
+        """
+    return verb
+
+def _get() -> typing.Callable[..., httpx.Response]:
+    """
+    Creates `get`, which also handles `soup_enabled`
+    """
+    def get(
+        self: 'Client', 
+        url: httpxType.URLTypes, 
+        *, 
+        soup_enabled: typing.Optional[bool] = None, 
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a `GET` request.
+
+        **Parameters**: See `httpx.request`.
+        """
+        cache = self._response_cache
+        if cache is None:
+            response = self.request("GET", url, **kwargs)
+        else:
+            key = self._get_cache_key(url, kwargs.get('params'))
+            entry = cache.get(key, kwargs.get('headers'))
+            response = None
+            if entry is not None:
+                response = cache.resolve(key, entry, self.request("GET", url, **{**kwargs, 'headers': entry.conditional_headers(kwargs.get('headers'))}))
+            if response is None:
+                # Not cached, or cached for a request with other credentials
+                response = cache.resolve(key, None, self.request("GET", url, **kwargs))
+        if soup_enabled is True or self._config.soup_enabled is True:
+            response = wrap_soup_response(response, self._soup_strainer)
+        return response
+    
+    get.__qualname__ = 'Client.get'
+    return get
+
+class _AsyncStreamContext:
+    """
+    Opens the streaming response on enter and closes it on exit
+    """
+
+    __slots__ = ('_create_stream', '_method', '_url', '_kwargs', '_response')
+
+    def __init__(
+        self,
+        create_stream: typing.Callable[..., typing.Awaitable[httpx.Response]],
+        method: str,
+        url: httpxType.URLTypes,
+        kwargs: typing.Dict[str, typing.Any],
+    ):
+        self._create_stream = create_stream
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+        self._response: typing.Optional[httpx.Response] = None
+
+    async def __aenter__(self) -> httpx.Response:
+        self._response = await self._create_stream(self._method, self._url, **self._kwargs)
+        return self._response
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._response.aclose()
+
+def _async_verb(method: str) -> typing.Callable[..., typing.Awaitable[httpx.Response]]:
+    """
+    Creates the `async_<method>` shortcut for `Client.async_request`
+    """
+    async def verb(self: 'Client', url: httpxType.URLTypes, **kwargs) -> httpx.Response:
+        return await self.async_request(method, url, **kwargs)
+
+    verb.__name__ = f'async_{method.lower()}'
+    verb.__qualname__ = f'Client.{verb.__name__}'
+    verb.__doc__ = f"""
+        Send {'an' if method[0] in 'AEIOU' else 'a'} `{method}` request.
+
+        **Parameters**: See `httpx.request`.
+        """
+    return verb
+
+def _async_verb_many(method: str) -> typing.Callable[..., typing.Awaitable[typing.List[typing.Union[httpx.Response, Exception]]]]:
+    """
+    Creates the `async_<method>_many` shortcut for `Client.async_request_many`
+    """
+    async def verb_many(
+        self: 'Client', 
+        urls: typing.Iterable[httpxType.URLTypes], 
+        **kwargs
+    ) -> typing.List[typing.Union[httpx.Response, Exception]]:
+        return await self.async_request_many(method, urls, **kwargs)
+
+    verb_many.__name__ = f'async_{method.lower()}_many'
+    verb_many.__qualname__ = f'Client.{verb_many.__name__}'
+    verb_many.__doc__ = f"""
+        Send {'an' if method[0] in 'AEIOU' else 'a'} `{method}` request to each of the urls concurrently.
+
+        **Parameters**: See `Client.async_request_many`.
+        """
+    return verb_many
+
+def _async_get() -> typing.Callable[..., typing.Awaitable[httpx.Response]]:
+    """
+    Creates `async_get`, which also handles `soup_enabled`
+    """
+    async def async_get(
+        self: 'Client', 
+        url: httpxType.URLTypes, 
+        *, 
+        soup_enabled: typing.Optional[bool] = None, 
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a `GET` request.
+
+        **Parameters**: See `httpx.request`.
+        """
+        cache = self._response_cache
+        if cache is None:
+            response = await self.async_request("GET", url, **kwargs)
+        else:
+            key = self._get_cache_key(url, kwargs.get('params'))
+            entry = cache.get(key, kwargs.get('headers'))
+            response = None
+            if entry is not None:
+                response = cache.resolve(key, entry, await self.async_request("GET", url, **{**kwargs, 'headers': entry.conditional_headers(kwargs.get('headers'))}))
+            if response is None:
+                # Not cached, or cached for a request with other credentials
+                response = cache.resolve(key, None, await self.async_request("GET", url, **kwargs))
+        if soup_enabled is True or self._config.soup_enabled is True:
+            response = wrap_soup_response(response, self._soup_strainer)
+        return response
+    
+    async_get.__qualname__ = 'Client.async_get'
+    return async_get
+
 class Client:
 
     """
@@ -104,12 +358,13 @@ class Client:
     two-tuple of (certificate file, key file), or a three-tuple of (certificate
     file, key file, password).
     * **http2** - *(optional)* A boolean indicating if HTTP/2 support should be
-    enabled. Defaults to `False`.
+    enabled. Defaults to `AiohttpxSettings.http2` if `h2` is installed, otherwise `False`.
     * **proxies** - *(optional)* A dictionary mapping HTTP protocols to proxy
     URLs.
     * **timeout** - *(optional)* The timeout configuration to use when sending
     requests.
-    * **limits** - *(optional)* The limits configuration to use.
+    * **limits** - *(optional)* The limits configuration to use. Defaults to the
+    connection pool limits in `AiohttpxSettings`.
     * **max_redirects** - *(optional)* The maximum number of redirect responses
     that should be followed.
     * **base_url** - *(optional)* A URL to use as the base when building
@@ -125,8 +380,40 @@ class Client:
     * **default_encoding** - *(optional)* The default encoding to use for decoding
     response text, if no charset information is included in a response Content-Type
     header. Set to a callable for automatic character set detection. Default: "utf-8".
+    * **dns_cache** - *(optional)* Enables caching of resolved host addresses across
+    new pool connections. Defaults to `AiohttpxSettings.dns_cache_enabled`.
+    * **cache** - *(optional)* Enables revalidating GET responses that have an `ETag`
+    or `Last-Modified` header, returning the cached body on a `304`. Defaults to
+    `AiohttpxSettings.cache_enabled`.
+    * **share_pool** - *(optional)* Sends requests through a connection pool shared with
+    the other clients that have the same pool configuration, instead of opening a pool
+    per client. Ignored if a custom transport, app or proxies are set. Defaults to
+    `AiohttpxSettings.share_pool`.
     """
 
+    __slots__ = (
+        'settings',
+        '_config',
+        '_sync_client',
+        '_async_client',
+        '_sync_request',
+        '_sync_send',
+        '_sync_build_request',
+        '_async_request',
+        '_async_send',
+        '_async_build_request',
+        '_soup_strainer',
+        '_log_request',
+        '_dns_cache',
+        '_response_cache',
+        '_share_pool',
+        '_sync_init_hooks_completed',
+        '_async_init_hooks_completed',
+        '_init_hooks',
+        '_incomplete_hooks',
+        '__weakref__',
+    )
+
     def __init__(
         self,
         *,
@@ -145,7 +432,7 @@ class Client:
 
         timeout: httpxType.TimeoutTypes = httpxType.DEFAULT_TIMEOUT_CONFIG,
         follow_redirects: typing.Optional[bool] = None,
-        limits: httpxType.Limits = httpxType.DEFAULT_LIMITS,
+        limits: typing.Optional[httpxType.Limits] = None,
         max_redirects: int = httpxType.DEFAULT_MAX_REDIRECTS,
         event_hooks: typing.Optional[
             typing.Mapping[str, typing.List[typing.Callable]]
@@ -164,11 +451,16 @@ class Client:
         soup_enabled: typing.Optional[bool] = None,
         debug: typing.Optional[bool] = None,
         init_hooks: typing.Optional[typing.List[typing.Union[typing.Tuple[typing.Callable, typing.Dict], typing.Callable]]] = None,
+        dns_cache: typing.Optional[bool] = None,
+        cache: typing.Optional[bool] = None,
+        share_pool: typing.Optional[bool] = None,
         settings: typing.Optional['AiohttpxSettings'] = None,
         **kwargs
     ):
         self.settings = settings or get_aiohttpx_settings()
         debug = debug if debug is not None else self.settings.debug
+        # Deferred from the settings so it only happens once a client is used
+        if not debug: mute_httpx_logger()
         self._config = ClientParams(
             auth=auth,
             params=params,
@@ -177,13 +469,13 @@ class Client:
             verify=verify,
             cert=cert,
             http1=http1,
-            http2=http2,
+            http2=http2 if http2 is not None else (self.settings.http2 and _h2._h2_available),
             proxies=proxies,
             mounts=mounts,
             async_mounts=async_mounts,
             timeout=timeout,
             follow_redirects=follow_redirects,
-            limits=limits,
+            limits=limits if limits is not None else self.settings.limits,
             max_redirects=max_redirects,
             event_hooks=event_hooks,
             async_event_hooks=async_event_hooks,
@@ -195,17 +487,35 @@ class Client:
             default_encoding=default_encoding,
             soup_enabled=soup_enabled,
             debug=debug,
-            kwargs=kwargs
+            kwargs=kwargs or None
         )
         self._sync_client: typing.Optional[httpx.Client] = None
         self._async_client: typing.Optional[httpx.AsyncClient] = None
+
+        # Bound methods of the pooled clients, set when they are created
+        self._sync_request: typing.Optional[typing.Callable[..., httpx.Response]] = None
+        self._sync_send: typing.Optional[typing.Callable[..., httpx.Response]] = None
+        self._sync_build_request: typing.Optional[typing.Callable[..., httpx.Request]] = None
+        self._async_request: typing.Optional[typing.Callable[..., typing.Awaitable[httpx.Response]]] = None
+        self._async_send: typing.Optional[typing.Callable[..., typing.Awaitable[httpx.Response]]] = None
+        self._async_build_request: typing.Optional[typing.Callable[..., httpx.Request]] = None
+
+        self._soup_strainer: typing.Optional['SoupStrainer'] = None
+
+        # Only set in debug mode, where it wraps the bound request methods of the clients
+        self._log_request: typing.Optional[typing.Callable[..., None]] = self._do_log_request if debug else None
+
+        dns_cache = dns_cache if dns_cache is not None else self.settings.dns_cache_enabled
+        self._dns_cache: typing.Optional[DNSCache] = get_dns_cache(ttl = self.settings.dns_cache_ttl) if dns_cache else None
+
+        cache = cache if cache is not None else self.settings.cache_enabled
+        self._response_cache: typing.Optional[ResponseCache] = ResponseCache(self.settings.cache_size) if cache else None
+
+        self._share_pool: bool = share_pool if share_pool is not None else self.settings.share_pool
         
         self._sync_init_hooks_completed: typing.Optional[bool] = False
         self._async_init_hooks_completed: typing.Optional[bool] = False
 
-        self._sync_active: bool = False
-        self._async_active: bool = False
-
         self._init_hooks: typing.Optional[typing.List[typing.Union[typing.Tuple[typing.Callable, typing.Dict], typing.Callable]]] = init_hooks or []
         # Reserved for the async client if the init hooks are coros
         self._incomplete_hooks: typing.Optional[typing.List[typing.Union[typing.Tuple[typing.Callable, typing.Dict], typing.Callable]]] = []
@@ -214,253 +524,215 @@ class Client:
     @property
     def async_client(self) -> httpx.AsyncClient:
         """
-        Returns an async client instance.
+        Returns the pooled async client instance, creating it once on first access.
         """
-        if self._async_client is None or not self._async_active:
-            self._async_client = httpx.AsyncClient(
-                **self._config.async_kwargs
-            )
-            self._async_active = True
-        return self._async_client
+        return self._async_client if self._async_client is not None else self._init_async_client()
 
     @property
     def sync_client(self) -> httpx.Client:
         """
-        Returns a sync client instance.
+        Returns the pooled sync client instance, creating it once on first access.
         """
-        if self._sync_client is None or not self._sync_active:
-            self._sync_client = httpx.Client(
-                **self._config.sync_kwargs
-            )
-            self._sync_active = True
-        return self._sync_client
-    
-    """
-    Base Url
-    """
-    @property
-    def base_url(self) -> typing.Union[str, httpx.URL]:
+        return self._sync_client if self._sync_client is not None else self._init_sync_client()
+
+    @staticmethod
+    def _do_log_request(
+        method: str,
+        url: httpxType.URLTypes,
+        headers: typing.Optional[httpxType.HeaderTypes] = None,
+        params: typing.Optional[httpxType.QueryParamTypes] = None,
+    ) -> None:
         """
-        Returns the base url
+        Logs the request in debug mode
         """
-        if self._async_client:
-            return self._async_client.base_url
-        return self._sync_client.base_url if self._sync_client else self._config.base_url
-    
-    @base_url.setter
-    def base_url(self, value: typing.Union[str, httpx.URL]) -> None:
-        return self.set_base_url(value)
-    
-    def set_base_url(self, base_url: httpxType.URLTypes):
+        logs.logger.info("Request: %s %s", method, url)
+        logs.logger.info("Headers: %s", headers)
+        logs.logger.info("Params: %s", params)
+
+    def _get_cache_key(
+        self,
+        url: httpxType.URLTypes,
+        params: typing.Optional[httpxType.QueryParamTypes] = None,
+    ) -> str:
         """
-        Sets the base url
+        Returns the response cache key for the request, including
+        the base url and params of the client
         """
-        if isinstance(base_url, str): base_url = httpx.URL(base_url)
-        if self._async_client:
-            self._async_client.base_url = base_url
-        if self._sync_client:
-            self._sync_client.base_url = base_url
-        self._config.base_url = str(base_url)
-
+        source = self._async_client if self._async_client is not None else self._sync_client
+        if source is None: source = self._config
+        return self._response_cache.get_key(url, params, source.base_url, source.params)
 
+    def _get_client_kwargs(
+        self,
+        kwargs: typing.Dict[str, typing.Any],
+        acquire: typing.Callable[..., typing.Union[httpx.BaseTransport, httpx.AsyncBaseTransport]],
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the kwargs for a new client, using the shared transport if enabled.
+        
+        The shared transport is reference counted, so closing the client
+        only closes the pool once no other client is using it. The async
+        pool is only shared between clients of the same event loop.
+        """
+        if not self._share_pool: return kwargs
+        key = get_pool_key(kwargs)
+        if key is None: return kwargs
+        transport = acquire(key, kwargs)
+        if transport is None: return kwargs
+        return {**kwargs, 'transport': transport}
+
+    def _init_async_client(self) -> httpx.AsyncClient:
+        """
+        Creates the async client and binds its hot methods
+        """
+        # Cached by the config until it changes
+        client = httpx.AsyncClient(**self._get_client_kwargs(self._config.async_kwargs, acquire_async_shared_transport))
+        if self._dns_cache is not None:
+            install_dns_cache(client, self._dns_cache)
+        self._async_request = client.request if self._log_request is None else \
+            _async_logged_request(client.request, self._log_request)
+        self._async_send = client.send
+        self._async_build_request = client.build_request
+        self._async_client = client
+        return client
+
+    def _init_sync_client(self) -> httpx.Client:
+        """
+        Creates the sync client and binds its hot methods
+        """
+        # Cached by the config until it changes
+        client = httpx.Client(**self._get_client_kwargs(self._config.sync_kwargs, acquire_shared_transport))
+        if self._dns_cache is not None:
+            install_dns_cache(client, self._dns_cache)
+        self._sync_request = client.request if self._log_request is None else \
+            _logged_request(client.request, self._log_request)
+        self._sync_send = client.send
+        self._sync_build_request = client.build_request
+        self._sync_client = client
+        return client
+    
     """
-    Headers
+    Client Attributes
     """
-    @property
-    def headers(self) -> typing.Dict[str, str]:
+
+    # Proxied through `__getattr__` / `__setattr__`
+    base_url: typing.Union[str, httpx.URL]
+    headers: typing.Dict[str, str]
+    params: typing.Dict[str, str]
+    cookies: typing.Dict[str, str]
+    auth: typing.Optional[httpxType.AuthTypes]
+    timeout: httpxType.TimeoutTypes
+    event_hooks: typing.Optional[typing.Mapping[str, typing.List[typing.Callable]]]
+
+    def __getattr__(self, name: str) -> typing.Any:
         """
-        Get the headers dictionary.
+        Returns the proxied client attribute.
 
-        The headers are retrieved in order of priority:
+        The attributes are retrieved in order of priority:
         1. From the async client if it exists
-        2. From the sync client if it exists  
+        2. From the sync client if it exists
         3. From the config
 
-        If no headers exist yet, initializes an empty dict in the config.
-
-        Returns:
-        Dict[str, str]: The headers dictionary.
+        If `headers`, `params` or `cookies` do not exist yet,
+        initializes an empty dict in the config.
         """
+        if name not in _PROXIED_ATTRS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        client = self._async_client if self._async_client is not None else self._sync_client
+        if client is not None:
+            return getattr(client, name)
+        value = getattr(self._config, name)
+        # The config value may be mutated in place by the caller
+        self._config.reset_kwargs()
+        if value is None and name in _DICT_ATTRS:
+            value = {}
+            setattr(self._config, name, value)
+        return value
 
-        if self._async_client is not None:
-            return self._async_client.headers
-        if self._sync_client is not None:
-            return self._sync_client.headers
-        if self._config.headers is None:
-            self._config.headers = {}
-        return self._config.headers
-
-    @headers.setter
-    def headers(self, key, value):
+    def __setattr__(self, name: str, value: typing.Any) -> None:
         """
-        Sets a header key/value pair.
-        """
-        if self._async_client is not None:
-            self._async_client.headers[key] = value
-        if self._sync_client is not None:
-            self._sync_client.headers[key] = value
-        if self._config.headers is None: self._config.headers = {}
-        self._config.headers[key] = value
-    
-    def set_headers(self, headers: httpxType.HeaderTypes):
+        Applies the proxied client attributes to the config and any active clients
         """
-        Sets the headers dictionary.
+        if name in _PROXIED_ATTRS:
+            return self._apply(name, value)
+        object.__setattr__(self, name, value)
+
+    def _apply(self, name: str, value: typing.Any) -> None:
         """
-        if self._async_client:
-            self._async_client.headers = headers
-        if self._sync_client:
-            self._sync_client.headers = headers
-        self._config.headers = headers
-    
-    """
-    cookies
-    """
-    @property
-    def cookies(self) -> typing.Dict[str, str]:
+        Sets the attribute on the config and any active clients
         """
-        Get the cookies dictionary.
+        self.reconfigure(**{name: value})
 
-        The cookies are retrieved in order of priority:
-        1. From the async client if it exists  
-        2. From the sync client if it exists
-        3. From the config
+    def reconfigure(self, **updates: typing.Any) -> None:
+        """
+        Sets multiple client attributes at once, updating the config
+        and each active client in a single pass.
 
-        If no cookies exist yet, initializes an empty dict in the config.
+        Supports `base_url`, `headers`, `params`, `cookies`, `auth` and `timeout`.
+        """
+        for name in updates:
+            if name == 'event_hooks':
+                raise AttributeError("`event_hooks` should be set with `set_event_hooks`")
+            if name not in _PROXIED_ATTRS:
+                raise AttributeError(f"'{type(self).__name__}' cannot reconfigure '{name}'")
+        base_url = updates.get('base_url')
+        if isinstance(base_url, str):
+            updates['base_url'] = _parse_url(base_url)
+        for client in (self._async_client, self._sync_client):
+            if client is None: continue
+            for name, value in updates.items():
+                setattr(client, name, value)
+        for name, value in updates.items():
+            setattr(self._config, name, str(value) if name == 'base_url' else value)
 
-        Returns:
-        Dict[str, str]: The cookies dictionary.
+    def set_base_url(self, base_url: httpxType.URLTypes):
+        """
+        Sets the base url
         """
+        self._apply('base_url', base_url)
 
-        if self._async_client is not None:
-            return self._async_client.cookies
-        if self._sync_client is not None:
-            return self._sync_client.cookies
-        if self._config.cookies is None:
-            self._config.cookies = {}
-        return self._config.cookies
-    
-    @cookies.setter
-    def cookies(self, key, value):
-        if self._async_client is not None:
-            self._async_client.cookies[key] = value
-        if self._sync_client is not None:
-            self._sync_client.cookies[key] = value
-        if self._config.cookies is None: self._config.cookies = {}
-        self._config.cookies[key] = value
+    def set_headers(self, headers: httpxType.HeaderTypes):
+        """
+        Sets the headers dictionary.
+        """
+        self._apply('headers', headers)
 
     def set_cookies(self, cookies: httpxType.CookieTypes):
         """
         Sets the cookies dictionary.
         """
-        if self._async_client:
-            self._async_client.cookies = cookies
-        if self._sync_client:
-            self._sync_client.cookies = cookies
-        self._config.cookies = cookies
-    
+        self._apply('cookies', cookies)
+
     def clear_cookies(self) -> None:
         """
         Clears the cookies dictionary.
         """
-        if self._async_client:
-            self._async_client.cookies = None
-        if self._sync_client:
-            self._sync_client.cookies = None
-        self._config.cookies = None
-
-    """
-    params
-    """
-
-    @property
-    def params(self) -> typing.Dict[str, str]:
-        """
-        Returns the params dictionary.
-        """
-        if self._async_client:
-            return self._async_client.params
-        if self._sync_client:
-            return self._sync_client.params
-        if self._config.params is None:
-            self._config.params = {}
-        return self._config.params
-    
-    @params.setter
-    def params(self, key, value):
-        if self._async_client:
-            self._async_client.params[key] = value
-        if self._sync_client:
-            self._sync_client.params[key] = value
-        if self._config.params is None: self._config.params = {}
-        self._config.params[key] = value
+        self._apply('cookies', None)
 
-    
     def set_params(self, params: httpxType.QueryParamTypes):
-        if self._async_client:
-            self._async_client.params = params
-        if self._sync_client:
-            self._sync_client.params = params
-        self._config.params = params
-
-    """
-    auth
-    """
-
-    @property
-    def auth(self) -> typing.Optional[httpxType.AuthTypes]:
         """
-        Returns the auth object.
+        Sets the params dictionary.
         """
-        if self._async_client:
-            return self._async_client.auth
-        return self._sync_client.auth if self._sync_client else self._config.auth
-    
-    @auth.setter
-    def auth(self, value: typing.Optional[httpxType.AuthTypes]):
-        if self._async_client:
-            self._async_client.auth = value
-        if self._sync_client:
-            self._sync_client.auth = value
-        self._config.auth = value
-
+        self._apply('params', params)
 
     def set_auth(self, auth: httpxType.AuthTypes):
         """
         Sets the auth object.
         """
-        if self._async_client:
-            self._async_client.auth = auth
-        if self._sync_client:
-            self._sync_client.auth = auth
-        self._config.auth = auth
+        self._apply('auth', auth)
 
-    """
-    timeout
-    """
-    @property
-    def timeout(self) -> httpxType.TimeoutTypes:
+    def set_timeout(self, timeout: httpxType.TimeoutTypes):
         """
-        Get the timeout configuration.
+        Sets the timeout configuration.
         """
-        if self._async_client:
-            return self._async_client.timeout
-        return self._sync_client.timeout if self._sync_client else self._config.timeout
+        self._apply('timeout', timeout)
 
-    @timeout.setter
-    def timeout(self, value: httpxType.TimeoutTypes):
-        if self._async_client:
-            self._async_client.timeout = value
-        if self._sync_client:
-            self._sync_client.timeout = value
-        self._config.timeout = value
-
-    
-    def set_timeout(self, timeout: httpxType.TimeoutTypes):
-        if self._async_client:
-            self._async_client.timeout = timeout
-        if self._sync_client:
-            self._sync_client.timeout = timeout
-        self._config.timeout = timeout
+    def set_soup_strainer(self, strainer: typing.Optional['SoupStrainer'] = None):
+        """
+        Sets the `bs4.SoupStrainer` used to only parse matching
+        elements of soup-enabled responses.
+        """
+        self._soup_strainer = strainer
 
     """
     proxies
@@ -480,16 +752,6 @@ class Client:
     event hooks
     """
 
-    @property
-    def event_hooks(self) -> typing.Optional[typing.Mapping[str, typing.List[typing.Callable]]]:
-        """
-        The event hooks dictionary.
-        """
-        if self._async_client:
-            return self._async_client.event_hooks
-        return self._sync_client.event_hooks if self._sync_client else self._config.event_hooks
-
-
     def set_event_hooks(
         self, 
         event_hooks: typing.Optional[typing.Mapping[str, typing.List[typing.Callable]]] = None,
@@ -559,7 +821,7 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
     ) -> httpx.Request:
         """
@@ -573,8 +835,9 @@ class Client:
 
         [0]: /advanced/#request-instances
         """
-        self._run_init_hooks()
-        return self.sync_client.build_request(
+        if not self._sync_init_hooks_completed: self._run_init_hooks()
+        if self._sync_client is None: self._init_sync_client()
+        return self._sync_build_request(
             method,
             url,
             content=content,
@@ -600,7 +863,7 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
     ) -> httpx.Request:
         """
@@ -614,8 +877,9 @@ class Client:
 
         [0]: /advanced/#request-instances
         """
-        await self._async_run_init_hooks()
-        return self.async_client.build_request(
+        if not self._async_init_hooks_completed: await self._async_run_init_hooks()
+        if self._async_client is None: self._init_async_client()
+        return self._async_build_request(
             method,
             url,
             content=content,
@@ -637,8 +901,8 @@ class Client:
         request: httpx.Request,
         *args,
         stream: bool = False,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
     ) -> httpx.Response:
         """
         Send a request.
@@ -653,8 +917,9 @@ class Client:
 
         [0]: /advanced/#request-instances
         """
-        await self._async_run_init_hooks()
-        return await self.async_client.send(
+        if not self._async_init_hooks_completed: await self._async_run_init_hooks()
+        if self._async_client is None: self._init_async_client()
+        return await self._async_send(
             request,
             *args,
             stream=stream,
@@ -674,9 +939,9 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
     ) -> httpx.Response:
         """
@@ -703,9 +968,12 @@ class Client:
             httpx.Response: The streaming response.
         """
 
-        request = await self.async_build_request(
-            method=method,
-            url=url,
+        # Builds the request directly rather than awaiting `async_build_request`
+        if not self._async_init_hooks_completed: await self._async_run_init_hooks()
+        if self._async_client is None: self._init_async_client()
+        request = self._async_build_request(
+            method,
+            url,
             content=content,
             data=data,
             files=files,
@@ -716,15 +984,14 @@ class Client:
             timeout=timeout,
             extensions=extensions,
         )
-        return await self.async_send(
-            request=request,
+        return await self._async_send(
+            request,
             auth=auth,
             follow_redirects=follow_redirects,
             stream=True,
         )
 
-    @asynccontextmanager
-    async def async_stream(
+    def async_stream(
         self,
         method: str,
         url: httpxType.URLTypes,
@@ -736,11 +1003,11 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
-    ) -> typing.AsyncIterator[httpx.Response]:
+    ) -> typing.AsyncContextManager[httpx.Response]:
         """
         Creates an asynchronous streaming response.
 
@@ -762,27 +1029,26 @@ class Client:
             extensions: Extensions to use.
 
         Returns:
-            typing.AsyncIterator[httpx.Response]: The streaming response.
+            typing.AsyncContextManager[httpx.Response]: The streaming response.
         """
-        response = await self.async_create_stream(
-            method=method,
-            url=url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
+        return _AsyncStreamContext(
+            self.async_create_stream,
+            method,
+            url,
+            dict(
+                content=content,
+                data=data,
+                files=files,
+                json=json,
+                params=params,
+                headers=headers,
+                cookies=cookies,
+                auth=auth,
+                follow_redirects=follow_redirects,
+                timeout=timeout,
+                extensions=extensions,
+            )
         )
-        try:
-            yield response
-        finally:
-            await response.aclose()
 
 
     async def async_request(
@@ -797,11 +1063,10 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
-        **kwargs,
     ) -> httpx.Response:
         """Sends an asynchronous HTTP request.
 
@@ -821,7 +1086,6 @@ class Client:
             follow_redirects: Whether to follow redirects.
             timeout: Timeout settings.
             extensions: Extensions to use.
-            kwargs: Additional arguments to pass to the request.
 
         Returns:
             httpx.Response: The HTTP response.
@@ -830,17 +1094,12 @@ class Client:
             Any exceptions raised by the async client.
         """
 
-        #if not self._async_active:
-        #    self._init_clients(_reset_async = True)
-        if self._config.debug:
-            logger.info(f"Request: {method} {url}")
-            logger.info(f"Headers: {headers}")
-            logger.info(f"Params: {params}")
-
-        await self._async_run_init_hooks()
-        return await self.async_client.request(
-            method=method,
-            url=url,
+        if not self._async_init_hooks_completed: await self._async_run_init_hooks()
+        if isinstance(url, str): url = _parse_url(url)
+        if self._async_client is None: self._init_async_client()
+        return await self._async_request(
+            method,
+            url,
             content=content,
             data=data,
             files=files,
@@ -852,239 +1111,61 @@ class Client:
             follow_redirects=follow_redirects,
             timeout=timeout,
             extensions=extensions,
-            **kwargs,
         )
     
-    async def async_get(
+    # Generated in `_async_verb` / `_async_get`, which forward everything
+    # but the url as keyword arguments to `async_request`
+    async_get = _async_get()
+    async_options = _async_verb('OPTIONS')
+    async_head = _async_verb('HEAD')
+    async_post = _async_verb('POST')
+    async_put = _async_verb('PUT')
+    async_patch = _async_verb('PATCH')
+    async_delete = _async_verb('DELETE')
+
+    async def async_request_many(
         self,
-        url: httpxType.URLTypes,
+        method: str,
+        urls: typing.Iterable[httpxType.URLTypes],
         *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-        soup_enabled: typing.Optional[bool] = None,
-    ) -> httpx.Response:
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        **kwargs,
+    ) -> typing.List[typing.Union[httpx.Response, Exception]]:
         """
-        Send a `GET` request.
+        Sends the same request to each of the urls concurrently,
+        with at most `concurrency` requests in flight.
+
+        Returns the responses in the order of the urls. A failed
+        request returns its exception rather than cancelling the rest.
 
         **Parameters**: See `httpx.request`.
         """
-        response = await self.async_request(
-            "GET",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-        if soup_enabled is True or self._config.soup_enabled is True:
-            response = wrap_soup_response(response)
-        return response
+        return await self.async_bulk_request([(method, url, kwargs) for url in urls], concurrency = concurrency)
 
-    async def async_options(
+    async_get_many = _async_verb_many('GET')
+    async_post_many = _async_verb_many('POST')
+
+    async def async_bulk_request(
         self,
-        url: httpxType.URLTypes,
+        requests: typing.Iterable[BulkRequest],
         *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> typing.List[typing.Union[httpx.Response, Exception]]:
         """
-        Send an `OPTIONS` request.
+        Sends each of the requests concurrently over the async client,
+        with at most `concurrency` requests in flight.
 
-        **Parameters**: See `httpx.request`.
+        Each request is a `(method, url)` or `(method, url, kwargs)` tuple.
+
+        Returns the responses in the order of the requests. A failed
+        request returns its exception rather than cancelling the rest.
         """
-        return await self.async_request(
-            "OPTIONS",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    async def async_head(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `HEAD` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return await self.async_request(
-            "HEAD",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    async def async_post(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `POST` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return await self.async_request(
-            "POST",
-            url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    async def async_put(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `PUT` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return await self.async_request(
-            "PUT",
-            url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    async def async_patch(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `PATCH` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return await self.async_request(
-            "PATCH",
-            url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    async def async_delete(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `DELETE` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return await self.async_request(
-            "DELETE",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
+        _validate_concurrency(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        async def _request(method: str, url: httpxType.URLTypes, kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None) -> httpx.Response:
+            async with semaphore:
+                return await self.async_request(method, url, **(kwargs or {}))
+        return await asyncio.gather(*[_request(*request) for request in requests], return_exceptions = True)
     
     """
     Sync Methods
@@ -1094,8 +1175,8 @@ class Client:
         request: httpx.Request,
         *args,
         stream: bool = False,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
     ) -> httpx.Response:
         """
         Send a request.
@@ -1110,8 +1191,9 @@ class Client:
 
         [0]: /advanced/#request-instances
         """
-        self._run_init_hooks()
-        return self.sync_client.send(
+        if not self._sync_init_hooks_completed: self._run_init_hooks()
+        if self._sync_client is None: self._init_sync_client()
+        return self._sync_send(
             request,
             *args,
             stream=stream,
@@ -1131,9 +1213,9 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
     ) -> httpx.Response:
         """
@@ -1193,9 +1275,9 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
     ) -> typing.Iterator[httpx.Response]:
         """
@@ -1254,11 +1336,10 @@ class Client:
         params: typing.Optional[httpxType.QueryParamTypes] = None,
         headers: typing.Optional[httpxType.HeaderTypes] = None,
         cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
-        **kwargs,
     ) -> httpx.Response:
         """Sends a synchronous HTTP request.
 
@@ -1278,7 +1359,6 @@ class Client:
             follow_redirects: Whether to follow redirects.
             timeout: Timeout settings.
             extensions: Extensions to use.
-            kwargs: Additional arguments to pass to the request.
         
         Returns:
             httpx.Response: The HTTP response.
@@ -1286,181 +1366,11 @@ class Client:
         Raises:
             Any exceptions raised by the sync client.
         """
-        #if not self._sync_active:
-        #    self._init_clients(_reset_sync = True)
-        if self._config.debug:
-            logger.info(f"Request: {method} {url}")
-            logger.info(f"Headers: {headers}")
-            logger.info(f"Params: {params}")
-        self._run_init_hooks()
-        return self.sync_client.request(
-            method=method,
-            url=url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-            **kwargs,
-        )
-    
-    def get(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-        soup_enabled: typing.Optional[bool] = None,
-    ) -> httpx.Response:
-        """
-        Send a `GET` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        response = self.request(
-            "GET",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-        if soup_enabled is True or self._config.soup_enabled is True:
-            response = wrap_soup_response(response)
-        return response
-
-    def options(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send an `OPTIONS` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return self.request(
-            "OPTIONS",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    def head(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `HEAD` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return self.request(
-            "HEAD",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    def post(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `POST` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return self.request(
-            "POST",
-            url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    def put(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `PUT` request.
-
-        **Parameters**: See `httpx.request`.
-        """
-        return self.request(
-            "PUT",
+        if not self._sync_init_hooks_completed: self._run_init_hooks()
+        if isinstance(url, str): url = _parse_url(url)
+        if self._sync_client is None: self._init_sync_client()
+        return self._sync_request(
+            method,
             url,
             content=content,
             data=data,
@@ -1474,116 +1384,79 @@ class Client:
             timeout=timeout,
             extensions=extensions,
         )
-
-    def patch(
+    
+    # Generated in `_verb` / `_get`, which forward everything
+    # but the url as keyword arguments to `request`
+    get = _get()
+    options = _verb('OPTIONS')
+    head = _verb('HEAD')
+    post = _verb('POST')
+    put = _verb('PUT')
+    patch = _verb('PATCH')
+    delete = _verb('DELETE')
+
+    def bulk_request(
         self,
-        url: httpxType.URLTypes,
+        requests: typing.Iterable[BulkRequest],
         *,
-        content: typing.Optional[httpxType.RequestContent] = None,
-        data: typing.Optional[httpxType.RequestData] = None,
-        files: typing.Optional[httpxType.RequestFiles] = None,
-        json: typing.Optional[typing.Any] = None,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> typing.List[typing.Union[httpx.Response, Exception]]:
         """
-        Send a `PATCH` request.
+        Sends each of the requests concurrently over the sync client,
+        using up to `concurrency` threads.
 
-        **Parameters**: See `httpx.request`.
-        """
-        return self.request(
-            "PATCH",
-            url,
-            content=content,
-            data=data,
-            files=files,
-            json=json,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
-
-    def delete(
-        self,
-        url: httpxType.URLTypes,
-        *,
-        params: typing.Optional[httpxType.QueryParamTypes] = None,
-        headers: typing.Optional[httpxType.HeaderTypes] = None,
-        cookies: typing.Optional[httpxType.CookieTypes] = None,
-        auth: typing.Union[httpxType.AuthTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpxType.TimeoutTypes, httpxType.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        extensions: typing.Optional[dict] = None,
-    ) -> httpx.Response:
-        """
-        Send a `DELETE` request.
+        Each request is a `(method, url)` or `(method, url, kwargs)` tuple.
 
-        **Parameters**: See `httpx.request`.
+        Returns the responses in the order of the requests. A failed
+        request returns its exception rather than cancelling the rest.
         """
-        return self.request(
-            "DELETE",
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            auth=auth,
-            follow_redirects=follow_redirects,
-            timeout=timeout,
-            extensions=extensions,
-        )
+        def _request(request: BulkRequest) -> typing.Union[httpx.Response, Exception]:
+            method, url, *kwargs = request
+            try:
+                return self.request(method, url, **(kwargs[0] if kwargs else {}))
+            except Exception as e:
+                return e
+        _validate_concurrency(concurrency)
+        if not self._sync_init_hooks_completed: self._run_init_hooks()
+        if self._sync_client is None: self._init_sync_client()
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            return list(executor.map(_request, requests))
 
     """
     Startup/Shutdown
     """
 
-    def startup(self) -> None:
-        pass
-
-    async def async_startup(self) -> None:
-        pass
-
-    def shutdown(self) -> None:
-        pass
-
-    async def async_shutdown(self) -> None:
-        pass
+    # Shared no-ops that subclasses override, which lets the context managers
+    # skip the call entirely when they are not overridden
+    startup = shutdown = _noop
+    async_startup = async_shutdown = _async_noop
 
     def close(self) -> None:
         """
         Close transport and proxies.
         """
-        self.shutdown()
-        if self._sync_active:
-            self.sync_client.close()
-            self._sync_active = False
-            
+        if type(self).shutdown is not _noop: self.shutdown()
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+            self._sync_request = self._sync_send = self._sync_build_request = None
 
     async def aclose(self) -> None:
         """
         Close transport and proxies.
         """
-        await self.async_shutdown()
-        if self._async_active:
-            await self.async_client.aclose()
-            self._async_active = False
+        if type(self).async_shutdown is not _async_noop: await self.async_shutdown()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_request = self._async_send = self._async_build_request = None
 
     def __enter__(self):
-        self.startup()
-        # self.sync_client.__enter__()
+        if type(self).startup is not _noop: self.startup()
         return self
 
     async def __aenter__(self):
-        await self.async_startup()
-        # await self.async_client.__aenter__()
+        if type(self).async_startup is not _async_noop: await self.async_startup()
         return self
     
     def __exit__(
@@ -1593,9 +1466,6 @@ class Client:
         traceback: typing.Optional[httpxType.TracebackType] = None,
     ) -> None:
         self.close()
-        if self._sync_active:
-            self.sync_client.__exit__(exc_type, exc_value, traceback)
-            self._sync_active = False
 
     async def __aexit__(
         self,
@@ -1603,7 +1473,4 @@ class Client:
         exc_value: typing.Optional[BaseException] = None,
         traceback: typing.Optional[httpxType.TracebackType] = None,
     ) -> None:
-        await self.aclose()
-        if self._async_active:
-            await self.async_client.__aexit__(exc_type, exc_value, traceback)
-            self._async_active = False
\ No newline at end of file
+        await self.aclose()
\ No newline at end of file
@@ -1,8 +1,11 @@
 import os
 import typing
-from aiohttpx.imports.pyd import BaseSettings, validator
+from aiohttpx.imports.pyd import BaseSettings, validator, PYD_VERSION, LAZY_TYPES
 from aiohttpx.imports.classprops import lazyproperty
 
+if typing.TYPE_CHECKING:
+    import httpx
+
 
 class AwsSettings(BaseSettings):
     """
@@ -33,8 +36,43 @@ class AiohttpxSettings(BaseSettings):
     soup_enabled: typing.Optional[bool] = False
     debug: typing.Optional[bool] = None
 
+    # Enables HTTP/2 by default when `h2` is installed
+    http2: typing.Optional[bool] = True
+
+    # Connection pool limits, used when a Client is created without `limits`.
+    # The defaults are httpx's own, these only make them configurable
+    max_connections: typing.Optional[int] = 100
+    max_keepalive_connections: typing.Optional[int] = 20
+    keepalive_expiry: typing.Optional[float] = 5.0
+
+    # Revalidates GET responses with an `ETag` / `Last-Modified`
+    cache_enabled: typing.Optional[bool] = False
+    cache_size: typing.Optional[int] = 128
+
+    dns_cache_enabled: typing.Optional[bool] = False
+    dns_cache_ttl: typing.Optional[float] = 300.0
+
+    # Shares one connection pool between clients with the same pool configuration
+    share_pool: typing.Optional[bool] = False
+
     class Config:
         env_prefix = "AIOHTTPX_"
+        if PYD_VERSION == 2:
+            ignored_types = LAZY_TYPES
+        else:
+            keep_untouched = LAZY_TYPES
+
+    @property
+    def limits(self) -> 'httpx.Limits':
+        """
+        Returns the connection pool limits from the current settings
+        """
+        import httpx
+        return httpx.Limits(
+            max_connections = self.max_connections,
+            max_keepalive_connections = self.max_keepalive_connections,
+            keepalive_expiry = self.keepalive_expiry,
+        )
 
     @lazyproperty
     def aws(self) -> AwsSettings:
@@ -52,7 +90,4 @@ class AiohttpxSettings(BaseSettings):
             "debug", 
             is_debug_mode()
         )
-        if v is False:
-            from aiohttpx.utils.logs import mute_httpx_logger
-            mute_httpx_logger()
         return v
\ No newline at end of file
@@ -2,32 +2,19 @@
 Import Handler for boto3, botocore, aioboto3, aiobotocore
 """
 
-try:
-    from botocore.exceptions import ClientError
-    from botocore.exceptions import EndpointConnectionError
-    _botocore_avail = True
+from importlib.util import find_spec
 
-except ImportError:
-    ClientError = Exception
-    EndpointConnectionError = Exception
-    _botocore_avail = False
+# The AWS libraries are only imported by the resolvers on first use,
+# so these are placeholders until then
+ClientError = Exception
+EndpointConnectionError = Exception
+BotoSession = object
+AsyncBotoClient = object
+AsyncBotoSession = object
 
-try:
-    from boto3.session import Session as BotoSession
-    _boto3_avail = True
-except ImportError:
-    BotoSession = object
-    _boto3_avail = False
-
-try:
-    from aiobotocore.client import BaseClient as AsyncBotoClient
-    from aioboto3.session import Session as AsyncBotoSession
-    _aioboto_avail = True
-
-except ImportError:
-    AsyncBotoClient = object
-    AsyncBotoSession = object
-    _aioboto_avail = False
+_botocore_avail = False
+_boto3_avail = False
+_aioboto_avail = False
 
 from aiohttpx.utils.imports import resolve_missing, require_missing_wrapper
 
@@ -40,7 +27,8 @@ def resolve_botocore(
     global _botocore_avail
     global ClientError, EndpointConnectionError
     if not _botocore_avail:
-        resolve_missing('botocore', required = required)
+        if find_spec('botocore') is None:
+            resolve_missing('botocore', required = required)
         from botocore.exceptions import ClientError
         from botocore.exceptions import EndpointConnectionError
         _botocore_avail = True
@@ -54,7 +42,8 @@ def resolve_boto3(
     global _boto3_avail
     global BotoSession
     if not _boto3_avail:
-        resolve_missing('boto3', required = required)
+        if find_spec('boto3') is None:
+            resolve_missing('boto3', required = required)
         from boto3.session import Session as BotoSession
         _boto3_avail = True
 
@@ -67,7 +56,8 @@ def resolve_aioboto(
     global _aioboto_avail
     global AsyncBotoClient, AsyncBotoSession
     if not _aioboto_avail:
-        resolve_missing(['aiobotocore', 'aioboto3'], required = required)
+        if find_spec('aiobotocore') is None or find_spec('aioboto3') is None:
+            resolve_missing(['aiobotocore', 'aioboto3'], required = required)
         from aiobotocore.client import BaseClient as AsyncBotoClient
         from aioboto3.session import Session as AsyncBotoSession
         _aioboto_avail = True
@@ -79,6 +69,8 @@ def resolve_boto(
     """
     Ensures that `boto3` and `botocore` are available
     """
+    # Called on every `require_boto` wrapped call, so return early once resolved
+    if _botocore_avail and (_aioboto_avail if is_async else _boto3_avail): return
     resolve_botocore(required = required)
     if is_async:
         resolve_aioboto(required = required)
@@ -2,12 +2,16 @@ import threading
 from typing import TypeVar, Callable, Optional
 
 _NotFound = object()
+
+# Shared by every lazyproperty, and only held while a value is first computed.
+# Reentrant, since computing one lazy value may access another.
+_LAZY_INIT_LOCK = threading.RLock()
 PropValue = TypeVar("PropValue")
 
 
 # Adapted from the recipe at
 # http://code.activestate.com/recipes/363602-lazy-property-evaluation
-class lazyproperty(property):
+class lazyproperty:
     """
     Works similarly to property(), but computes the value only once.
 
@@ -33,49 +37,57 @@ class lazyproperty(property):
     the ``print`` statement is not executed.  Only the return value from the
     first access off ``complicated_property`` is returned.
 
-    By default, a setter and deleter are used which simply overwrite and
-    delete, respectively, the value stored in ``__dict__``. Any user-specified
-    setter or deleter is executed before executing these default actions.
-    The one exception is that the default setter is not run if the user setter
-    already sets the new value in ``__dict__`` and returns that value and the
-    returned value is not ``None``.
+    This is a non-data descriptor, so once the value is stored in ``__dict__``,
+    attribute lookups find it there without calling the descriptor again.
+    Assigning or deleting the attribute simply overwrites or removes the
+    value stored in ``__dict__``.
 
     """
 
-    def __init__(self, fget: Callable, fset: Optional[Callable] = None, fdel: Optional[Callable] = None, doc: Optional[str] = None):
-        super().__init__(fget, fset, fdel, doc)
+    def __init__(self, fget: Callable, doc: Optional[str] = None):
+        self.fget = fget
+        self.__doc__ = doc or fget.__doc__
         self._key = self.fget.__name__
-        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type, name: str):
+        self._key = name
 
     def __get__(self, obj: object, owner=None) -> PropValue:
-        try:
-            obj_dict = obj.__dict__
-            val = obj_dict.get(self._key, _NotFound)
-            if val is _NotFound:
-                with self._lock:
-                    # Check if another thread beat us to it.
-                    val = obj_dict.get(self._key, _NotFound)
-                    if val is _NotFound:
-                        val = self.fget(obj)
-                        obj_dict[self._key] = val
-            return val
-        except AttributeError:
-            if obj is None:
-                return self
-            raise
-
-    def __set__(self, obj: object, val: PropValue):
+        if obj is None:
+            return self
         obj_dict = obj.__dict__
-        if self.fset:
-            ret = self.fset(obj, val)
-            if ret is not None and obj_dict.get(self._key) is ret:
-                # By returning the value set the setter signals that it
-                # took over setting the value in obj.__dict__; this
-                # mechanism allows it to override the input value
-                return
-        obj_dict[self._key] = val
-
-    def __delete__(self, obj: object):
-        if self.fdel:
-            self.fdel(obj)
-        obj.__dict__.pop(self._key, None)    # Delete if present
\ No newline at end of file
+        val = obj_dict.get(self._key, _NotFound)
+        if val is _NotFound:
+            with _LAZY_INIT_LOCK:
+                # Check if another thread beat us to it.
+                val = obj_dict.get(self._key, _NotFound)
+                if val is _NotFound:
+                    val = self.fget(obj)
+                    obj_dict[self._key] = val
+        return val
+
+
+class cachedproperty:
+    """
+    A lock-free alternative to ``lazyproperty`` for values that are only
+    computed from a single thread, such as per-response attributes.
+
+    This is a non-data descriptor, so once the value is stored in the
+    ``__dict__`` of the instance, it is returned directly without calling
+    the descriptor again.
+    """
+
+    __slots__ = ('fget', '_key')
+
+    def __init__(self, fget: Callable[[object], PropValue]):
+        self.fget = fget
+        self._key = fget.__name__
+
+    def __set_name__(self, owner: type, name: str):
+        self._key = name
+
+    def __get__(self, obj: object, owner=None) -> PropValue:
+        if obj is None:
+            return self
+        val = obj.__dict__[self._key] = self.fget(obj)
+        return val
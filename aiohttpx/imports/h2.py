@@ -0,0 +1,20 @@
+"""
+Import Handler for h2
+"""
+
+from importlib.util import find_spec
+from aiohttpx.utils.imports import resolve_missing
+
+# `h2` is only checked for, since httpx imports it itself when `http2` is enabled
+_h2_available = find_spec('h2') is not None
+
+def resolve_h2(
+    required: bool = False,
+):
+    """
+    Ensures that `h2` is available
+    """
+    global _h2_available
+    if not _h2_available:
+        resolve_missing('h2', required = required)
+        _h2_available = find_spec('h2') is not None
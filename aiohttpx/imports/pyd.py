@@ -44,18 +44,37 @@ except ImportError:
         from pydantic import BaseSettings
 
 from pydantic import BaseModel as _BaseModel
+from pydantic import PrivateAttr
+from aiohttpx.imports.classprops import lazyproperty, cachedproperty
+
+# Descriptors that pydantic should leave as class attributes rather than fields
+LAZY_TYPES = (lazyproperty, cachedproperty)
 
 class BaseModel(_BaseModel):
 
     class Config:
         extra = 'allow'
         arbitrary_types_allowed = True
+        if PYD_VERSION == 2:
+            ignored_types = LAZY_TYPES
+        else:
+            keep_untouched = LAZY_TYPES
+
+
 
+# Picked once for the installed version rather than checked on every call
+if PYD_VERSION == 2:
+    def get_pyd_dict(model: BaseModel, **kwargs) -> typing.Dict[str, typing.Any]:
+        """
+        Get a dict from a pydantic model
+        """
+        return model.model_dump(**kwargs)
 
+else:
+    def get_pyd_dict(model: BaseModel, **kwargs) -> typing.Dict[str, typing.Any]:
+        """
+        Get a dict from a pydantic model
+        """
+        return model.dict(**kwargs)
 
-def get_pyd_dict(model: BaseModel, **kwargs) -> typing.Dict[str, typing.Any]:
-    """
-    Get a dict from a pydantic model
-    """
-    return model.model_dump(**kwargs) if PYD_VERSION == 2 else model.dict(**kwargs)
 
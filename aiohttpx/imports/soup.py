@@ -4,16 +4,23 @@ Import Handler for bs4
 """
 
 
+from importlib.util import find_spec
 from aiohttpx.utils.imports import resolve_missing, require_missing_wrapper
 
-try:
-    from bs4 import BeautifulSoup
-    from bs4.element import Tag
-    _bs4_available = True
-except ImportError:
-    BeautifulSoup = object
-    Tag = object
-    _bs4_available = False
+# bs4 is only imported by `resolve_bs4` on first use
+BeautifulSoup = None
+Tag = None
+_bs4_available = False
+
+# `lxml` is used as the parser when it is installed, since it is
+# significantly faster than the builtin `html.parser`
+_lxml_available = find_spec('lxml') is not None
+
+def get_soup_parser() -> str:
+    """
+    Returns the fastest available parser for `BeautifulSoup`
+    """
+    return 'lxml' if _lxml_available else 'html.parser'
 
 def resolve_bs4(
     required: bool = False,
@@ -22,11 +29,12 @@ def resolve_bs4(
     Ensures that `bs4` is available
     """
     global _bs4_available, BeautifulSoup, Tag
-    if not _bs4_available:
+    if _bs4_available: return
+    if find_spec('bs4') is None:
         resolve_missing('bs4', required = required)
-        from bs4 import BeautifulSoup
-        from bs4.element import Tag
-        _bs4_available = True
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag
+    _bs4_available = True
 
 
 def require_bs4(
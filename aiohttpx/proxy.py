@@ -1,17 +1,60 @@
 
 ## Applies the proxy-gateway to aiohttpx
+import os
 import httpx
 import random
-import struct
 import socket
 import typing
+from httpx._client import USE_CLIENT_DEFAULT
 
-from aiohttpx.utils import logger
-from aiohttpx.client import Client
+from aiohttpx.utils import logs
+from aiohttpx.client import Client, _noop
 from aiohttpx.schemas.proxies import ProxyManager
 
+_DEFAULT_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+_STAGE_PATH = "/proxy-stage/"
+
+# Random IPs for the `X-Forwarded-Header`, generated in batches
+# from a single `os.urandom` call and refilled once used up
+_IP_POOL_SIZE = 4096
+_ip_pool: typing.List[str] = []
+
+def _get_path(url: typing.Union[str, httpx.URL]) -> str:
+    """
+    Returns the path (and query) of the url relative to the host,
+    which is forwarded through the gateway
+    """
+    scheme, sep, rest = str(url).partition("://")
+    # Relative urls are resolved against the gateway's base url
+    return rest.partition("/")[2] if sep else scheme.lstrip("/")
+
+def _random_ip() -> str:
+    """
+    Returns a random IP address
+    """
+    global _ip_pool
+    if not _ip_pool:
+        raw = os.urandom(4 * _IP_POOL_SIZE)
+        _ip_pool = [socket.inet_ntoa(raw[i:i + 4]) for i in range(0, len(raw), 4)]
+    return _ip_pool.pop()
+
 class ProxyClient(Client):
 
+    __slots__ = (
+        '_uri',
+        'aws_access_key_id',
+        'aws_secret_access_key',
+        'host_header',
+        'verbose',
+        'proxy_manager',
+        '_gw_active',
+        '_endpoints_by_region',
+        '_base_proxy_headers',
+        '_log_proxy',
+        '_parent_request',
+        '_parent_async_request',
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -48,29 +91,109 @@ class ProxyClient(Client):
             pagination_limit = pagination_limit,
         )
         self._gw_active = False
+        # Endpoint urls by region, with all of them under `None`, set on startup
+        self._endpoints_by_region: typing.Optional[typing.Dict[typing.Optional[str], typing.Tuple[str, ...]]] = None
+        # Headers sent with every request, merged with the request headers
+        self._base_proxy_headers: typing.Dict[str, str] = {
+            "X-Host": self.host_header,
+            "X-User-Agent": _DEFAULT_UA,
+        }
         super().__init__(*args, **kwargs)
+        # Bound once so requests skip the debug check unless `debug` is passed
+        self._log_proxy: typing.Callable[..., None] = logs.logger.info if self._config.debug else _noop
+        # Bound once rather than going through `super()` on every request
+        self._parent_request = Client.request.__get__(self, type(self))
+        self._parent_async_request = Client.async_request.__get__(self, type(self))
     
 
     async def async_startup(self) -> None:
         if self._gw_active: return
-        await self.proxy_manager.async_build_endpoints()
+        try:
+            await self.proxy_manager.async_build_endpoints()
+        except BaseException:
+            # `__aexit__` is not called if entering the context fails
+            await self.proxy_manager.aclose()
+            raise
+        self._cache_endpoints()
         self._gw_active = True
         
     async def async_shutdown(self, force: bool = False) -> None:
-        if not self._gw_active: return
-        await self.proxy_manager.async_clear_apis(force = force)
-        self._gw_active = False
+        try:
+            if not self._gw_active: return
+            await self.proxy_manager.async_clear_apis(force = force)
+            self._endpoints_by_region = None
+            self._gw_active = False
+        finally:
+            # The clients may have been opened by a failed startup
+            await self.proxy_manager.aclose()
     
     def startup(self) -> None:
         if self._gw_active: return
-        self.proxy_manager.build_endpoints()
+        try:
+            self.proxy_manager.build_endpoints()
+        except BaseException:
+            # `__exit__` is not called if entering the context fails
+            self.proxy_manager.close()
+            raise
+        self._cache_endpoints()
         self._gw_active = True
 
     def shutdown(self, force: bool = False) -> None:
-        if not self._gw_active: return
-        self.proxy_manager.clear_apis(force = force)
-        self._gw_active = False
+        try:
+            if not self._gw_active: return
+            self.proxy_manager.clear_apis(force = force)
+            self._endpoints_by_region = None
+            self._gw_active = False
+        finally:
+            # The clients may have been opened by a failed startup
+            self.proxy_manager.close()
     
+    def _cache_endpoints(self) -> None:
+        """
+        Caches the endpoint urls of the gateways by region
+        """
+        self._endpoints_by_region = {
+            region: data.endpoint_urls
+            for region, data in self.proxy_manager.regions_data.items()
+        }
+        self._endpoints_by_region[None] = self.proxy_manager.all_endpoints
+
+    def _prepare_proxy_request(
+        self,
+        url: typing.Union[str, typing.Any],
+        headers: typing.Optional[httpx._client.HeaderTypes] = None,
+        region: typing.Optional[str] = None,
+        debug: typing.Optional[bool] = False,
+    ) -> typing.Tuple[str, typing.Union[httpx.Headers, typing.Dict[str, str]]]:
+        """
+        Returns the gateway url and the headers for the request
+        """
+        # A falsy region uses all of the endpoints
+        endpoints = self._endpoints_by_region.get(region or None) if self._endpoints_by_region is not None else None
+        if endpoints:
+            endpoint = endpoints[0] if len(endpoints) == 1 else random.choice(endpoints)
+        else:
+            endpoint = self.proxy_manager.get_randomized_endpoint(region = region)
+        url = f"https://{endpoint}{_STAGE_PATH}{_get_path(url)}"
+        log = logs.logger.info if debug else self._log_proxy
+        log("Sending request to %s", url)
+        # Copied into `httpx.Headers` so the caller's headers are not modified,
+        # and any mapping or key case is handled. A `X-Forwarded-For` set by
+        # the caller is sent as the forwarded IP
+        if headers:
+            headers = httpx.Headers(headers)
+            forwarded = headers.pop("X-Forwarded-For", None)
+            user_agent = headers.get("User-Agent")
+            proxy_headers = httpx.Headers(self._base_proxy_headers)
+            proxy_headers.update(headers)
+            proxy_headers["X-Forwarded-Header"] = forwarded or _random_ip()
+            if user_agent: proxy_headers["X-User-Agent"] = user_agent
+            headers = proxy_headers
+        else:
+            headers = {**self._base_proxy_headers, "X-Forwarded-Header": _random_ip()}
+        log("Headers: %s", headers)
+        return url, headers
+
     async def async_request(
         self,
         method: str,
@@ -83,29 +206,17 @@ class ProxyClient(Client):
         params: typing.Optional[httpx._client.QueryParamTypes] = None,
         headers: typing.Optional[httpx._client.HeaderTypes] = None,
         cookies: typing.Optional[httpx._client.CookieTypes] = None,
-        auth: typing.Union[httpx._client.AuthTypes, httpx._client.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpx._client.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpx._client.TimeoutTypes, httpx._client.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpx._client.AuthTypes, httpx._client.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpx._client.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpx._client.TimeoutTypes, httpx._client.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
         region: typing.Optional[str] = None,
         debug: typing.Optional[bool] = False,
     ) -> httpx.Response:
         if not self._gw_active:
             await self.async_startup()
-        endpoint = self.proxy_manager.get_randomized_endpoint(region = region)
-        try: path = url.split("://", 1)[1].split("/", 1)[1]
-        except IndexError: path = ""
-        url = f"https://{endpoint}/proxy-stage/{path}"
-        if debug or self._config.debug:
-            logger.info(f"Sending request to {url}")
-        headers = headers or {}
-        headers.pop("X-Forwarded-For", None)
-        headers["X-Host"] = self.host_header
-        headers["X-Forwarded-Header"] = headers.get("X-Forwarded-For") or socket.inet_ntoa(struct.pack(">I", random.randint(1, 0xffffffff)))
-        headers["X-User-Agent"] = headers.get("User-Agent") or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        if debug or self._config.debug:
-            logger.info(f"Headers: {headers}")
-        return await super().async_request(
+        url, headers = self._prepare_proxy_request(url, headers, region = region, debug = debug)
+        return await self._parent_async_request(
             method,
             url,
             content=content,
@@ -138,28 +249,16 @@ class ProxyClient(Client):
         params: typing.Optional[httpx._client.QueryParamTypes] = None,
         headers: typing.Optional[httpx._client.HeaderTypes] = None,
         cookies: typing.Optional[httpx._client.CookieTypes] = None,
-        auth: typing.Union[httpx._client.AuthTypes, httpx._client.UseClientDefault, None] = httpx._client.USE_CLIENT_DEFAULT,
-        follow_redirects: typing.Union[bool, httpx._client.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
-        timeout: typing.Union[httpx._client.TimeoutTypes, httpx._client.UseClientDefault] = httpx._client.USE_CLIENT_DEFAULT,
+        auth: typing.Union[httpx._client.AuthTypes, httpx._client.UseClientDefault, None] = USE_CLIENT_DEFAULT,
+        follow_redirects: typing.Union[bool, httpx._client.UseClientDefault] = USE_CLIENT_DEFAULT,
+        timeout: typing.Union[httpx._client.TimeoutTypes, httpx._client.UseClientDefault] = USE_CLIENT_DEFAULT,
         extensions: typing.Optional[dict] = None,
         region: typing.Optional[str] = None,
         debug: typing.Optional[bool] = False,
     ) -> httpx.Response:
         if not self._gw_active: self.startup()
-        endpoint = self.proxy_manager.get_randomized_endpoint(region = region)
-        try: path = url.split("://", 1)[1].split("/", 1)[1]
-        except IndexError: path = ""
-        url = f"https://{endpoint}/proxy-stage/{path}"
-        if debug or self._config.debug:
-            logger.info(f"Sending request to {url}")
-        headers = headers or {}
-        headers.pop("X-Forwarded-For", None)
-        headers["X-Host"] = self.host_header
-        headers["X-Forwarded-Header"] = headers.get("X-Forwarded-For") or socket.inet_ntoa(struct.pack(">I", random.randint(1, 0xffffffff)))
-        headers["X-User-Agent"] = headers.get("User-Agent") or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        if debug or self._config.debug:
-            logger.info(f"Headers: {headers}")
-        return super().request(
+        url, headers = self._prepare_proxy_request(url, headers, region = region, debug = debug)
+        return self._parent_request(
             method,
             url,
             content=content,
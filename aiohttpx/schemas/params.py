@@ -1,11 +1,28 @@
+import sys
 import httpx
 import typing
-from aiohttpx.imports.pyd import BaseModel, get_pyd_dict
-from aiohttpx.schemas import types as httpxType 
+import dataclasses
+from aiohttpx.schemas import types as httpxType
 
-class ClientParams(BaseModel):
+# `slots` is only supported by dataclasses on Python 3.10+
+_DATACLASS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# The fields that are not passed to the clients
+_SYNC_EXCLUDE = frozenset({'async_transport', 'async_mounts', 'async_event_hooks', 'soup_enabled', 'debug', 'kwargs'})
+# The async client uses the async field if it is set, otherwise the sync one
+_ASYNC_OVERRIDES = {
+    'transport': 'async_transport',
+    'mounts': 'async_mounts',
+    'event_hooks': 'async_event_hooks',
+}
+
+@dataclasses.dataclass(**_DATACLASS_KWARGS)
+class ClientParams:
     """
     Used to store the params for the Client class
+
+    A plain container, since httpx validates the values
+    when the clients are created.
     """
     auth: typing.Optional[httpxType.AuthTypes] = None
     params: typing.Optional[httpxType.QueryParamTypes] = None
@@ -20,12 +37,13 @@ class ClientParams(BaseModel):
     mounts: typing.Optional[typing.Mapping[str, httpx._client.BaseTransport]] = None
     async_mounts: typing.Optional[typing.Mapping[str, httpx._client.AsyncBaseTransport]] = None
 
+    # The httpx defaults are unhashable, so dataclasses require a factory
     timeout: typing.Optional[
         typing.Union[typing.Optional[float], typing.Tuple[typing.Optional[float], typing.Optional[float], typing.Optional[float], typing.Optional[float]],
         httpx._client.Timeout,
-    ]] = httpx._client.DEFAULT_TIMEOUT_CONFIG
+    ]] = dataclasses.field(default_factory = lambda: httpx._client.DEFAULT_TIMEOUT_CONFIG)
     follow_redirects: typing.Optional[bool] = None
-    limits: httpx._client.Limits = httpx._client.DEFAULT_LIMITS
+    limits: httpx._client.Limits = dataclasses.field(default_factory = lambda: httpx._client.DEFAULT_LIMITS)
     max_redirects: int = httpx._client.DEFAULT_MAX_REDIRECTS
     event_hooks: typing.Optional[typing.Mapping[str, typing.List[typing.Callable]]] = None
     async_event_hooks: typing.Optional[typing.Mapping[str, typing.List[typing.Callable]]] = None
@@ -40,36 +58,52 @@ class ClientParams(BaseModel):
     debug: typing.Optional[bool] = None
     soup_enabled: typing.Optional[bool] = None
 
+    # The kwargs are cached until a field is set
+    _sync_kwargs: typing.Optional[typing.Dict] = dataclasses.field(default = None, init = False, repr = False, compare = False)
+    _async_kwargs: typing.Optional[typing.Dict] = dataclasses.field(default = None, init = False, repr = False, compare = False)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        # `super()` cannot be used, since `slots` creates a new class
+        object.__setattr__(self, name, value)
+        if name[0] != '_': self.reset_kwargs()
+
+    def reset_kwargs(self) -> None:
+        """
+        Clears the cached kwargs, such as after a field is mutated in place
+        """
+        object.__setattr__(self, '_sync_kwargs', None)
+        object.__setattr__(self, '_async_kwargs', None)
+
     @property
     def sync_kwargs(self) -> typing.Dict:
         """
         Returns the sync kwargs
         """
-        data = get_pyd_dict(
-            self, 
-            exclude_none = True, 
-            exclude = {'async_transport', 'async_mounts', 'async_event_hooks', 'soup_enabled', 'debug'}
-        )
-        kwargs = data.pop('kwargs', None)
-        if kwargs: data.update(kwargs)
-        return data
-    
+        if self._sync_kwargs is None:
+            data = {}
+            for name in _SYNC_FIELDS:
+                value = getattr(self, name)
+                if value is not None: data[name] = value
+            if self.kwargs: data.update(self.kwargs)
+            object.__setattr__(self, '_sync_kwargs', data)
+        return self._sync_kwargs
+
     @property
     def async_kwargs(self) -> typing.Dict:
         """
         Returns the async kwargs
         """
-        data = get_pyd_dict(
-            self, 
-            exclude_none = True, 
-            exclude = {'soup_enabled', 'debug'}
-        )
-        if data.get('async_transport'):
-            data['transport'] = data.pop('async_transport', None)
-        if data.get('async_mounts'):
-            data['mounts'] = data.pop('async_mounts', None)
-        if data.get('async_event_hooks'):
-            data['event_hooks'] = data.pop('async_event_hooks', None)
-        kwargs = data.pop('kwargs', None)
-        if kwargs: data.update(kwargs)
-        return data
+        if self._async_kwargs is None:
+            data = {}
+            for name, override in _ASYNC_FIELDS:
+                value = (override and getattr(self, override)) or getattr(self, name)
+                if value is not None: data[name] = value
+            if self.kwargs: data.update(self.kwargs)
+            object.__setattr__(self, '_async_kwargs', data)
+        return self._async_kwargs
+
+
+# The field names passed to the clients, resolved once
+_SYNC_FIELDS = tuple(f.name for f in dataclasses.fields(ClientParams) if f.init and f.name not in _SYNC_EXCLUDE)
+# Paired with the async field that takes priority, if any
+_ASYNC_FIELDS = tuple((name, _ASYNC_OVERRIDES.get(name)) for name in _SYNC_FIELDS)
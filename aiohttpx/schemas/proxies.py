@@ -3,28 +3,27 @@ import asyncio
 import random
 import uuid
 import typing
+import threading
+import contextlib
 import concurrent.futures
 
 
 # from lazyops.utils import logger
 # from lazyops.types import BaseModel, validator, lazyproperty
 # from aiohttpx.configs import settings
-from aiohttpx.imports.boto import (
-    ClientError,
-    EndpointConnectionError,
-    BotoSession,
-    AsyncBotoClient,
-    AsyncBotoSession,
-    require_boto,
-)
+# Referenced through the module, since the resolvers
+# replace the placeholders when the libraries are imported
+from aiohttpx.imports import boto
+from aiohttpx.imports.boto import require_boto
 from aiohttpx.imports.pyd import (
     BaseModel,
+    PrivateAttr,
     validator,
     pre_root_validator
 )
 from aiohttpx.imports.classprops import lazyproperty
 from aiohttpx.utils.lazy import get_aiohttpx_settings
-from aiohttpx.utils.logs import logger
+from aiohttpx.utils import logs
 
 _aws_regions_default = [
     'us-east-1'
@@ -42,6 +41,25 @@ _aws_region_map = {
     'all': _aws_regions_all,
 }
 
+# The request parameters of the gateway's proxy methods and integrations.
+# Kept as plain dicts, since botocore only accepts `dict` for map params
+_METHOD_REQUEST_PARAMS = {
+    "method.request.path.proxy": True,
+    "method.request.header.X-Forwarded-Header": True,
+    "method.request.header.X-Host": True,
+    "method.request.header.X-User-Agent": True,
+}
+_INTEGRATION_REQUEST_PARAMS = {
+    "integration.request.path.proxy": "method.request.path.proxy",
+    "integration.request.header.X-Forwarded-For": "method.request.header.X-Forwarded-Header",
+    "integration.request.header.Host": "method.request.header.X-Host",
+    "integration.request.header.User-Agent": "method.request.header.X-User-Agent",
+}
+
+# How many APIs of a single region are deleted at once. DeleteRestApi is
+# heavily throttled by AWS, so more only leads to TooManyRequestsException
+_DELETE_CONCURRENCY = 2
+
 
 __all__ = [
     'ProxyManager',
@@ -69,25 +87,44 @@ class ProxyRegion(BaseModel):
     def num_to_create(self):
         return max(0, self.num_gateways - len(self.endpoints))
     
+    # Built on first access, and reset by `reset_endpoints`
+    # whenever the endpoints change
+    _endpoint_ids: typing.Optional[typing.FrozenSet[str]] = PrivateAttr(default = None)
+    _endpoint_urls: typing.Optional[typing.Tuple[str, ...]] = PrivateAttr(default = None)
+
     @property
-    def endpoint_ids(self):
-        return [e.api_id for e in self.endpoints]
+    def endpoint_ids(self) -> typing.FrozenSet[str]:
+        if self._endpoint_ids is None:
+            self._endpoint_ids = frozenset(e.api_id for e in self.endpoints)
+        return self._endpoint_ids
     
     @property
-    def endpoint_urls(self):
-        return [e.endpoint for e in self.endpoints]
+    def endpoint_urls(self) -> typing.Tuple[str, ...]:
+        if self._endpoint_urls is None:
+            self._endpoint_urls = tuple(e.endpoint for e in self.endpoints)
+        return self._endpoint_urls
+    
+    def reset_endpoints(self):
+        """
+        Resets the cached endpoint ids and urls
+        """
+        self._endpoint_ids = None
+        self._endpoint_urls = None
     
     def filter_endpoints(self, data: typing.List[typing.Dict]):
         """
         Filters from the data the endpoints that match this region
         """
+        existing = {e.api_id for e in self.endpoints}
         for api in data:
-            if api['name'].startswith(self.name) and api['id'] not in self.endpoint_ids:
+            if api['name'].startswith(self.name) and api['id'] not in existing:
+                existing.add(api['id'])
                 self.endpoints.append(ProxyEndpoint(
                     name = api['name'],
                     api_id= api['id'],
                     region= self.region,
                 ))
+        self.reset_endpoints()
 
 
 
@@ -109,6 +146,15 @@ class ProxyManager(BaseModel):
 
     pagination_limit: typing.Optional[int] = 50
 
+    # The apigateway clients, created once per region and reused
+    _region_clients: typing.Dict[str, typing.Any] = PrivateAttr(default_factory = dict)
+    # Held while a client is created, since the clear threads share them
+    _region_clients_lock: threading.Lock = PrivateAttr(default_factory = threading.Lock)
+    _async_region_clients: typing.Dict[str, 'asyncio.Future'] = PrivateAttr(default_factory = dict)
+    _async_exit_stack: typing.Optional[contextlib.AsyncExitStack] = PrivateAttr(default = None)
+    # Reset whenever endpoints are added or removed
+    _endpoint_cache: typing.Optional[typing.Tuple[str, ...]] = PrivateAttr(default = None)
+
     @validator('regions', pre = True, always = True)
     def validate_regions(cls, v):
         if isinstance(v, str):
@@ -153,9 +199,18 @@ class ProxyManager(BaseModel):
     def get_name(self):
         return self.get_unique_name() if self.unique_names else self.base_name
     
+    def _endpoints_changed(self, region: str) -> None:
+        """
+        Resets the cached endpoints after the region's endpoints change
+        """
+        self.regions_data[region].reset_endpoints()
+        self._endpoint_cache = None
+
     @property
-    def all_endpoints(self):
-        return [e.endpoint for r in self.regions_data.values() for e in r.endpoints]
+    def all_endpoints(self) -> typing.Tuple[str, ...]:
+        if self._endpoint_cache is None:
+            self._endpoint_cache = tuple(e.endpoint for r in self.regions_data.values() for e in r.endpoints)
+        return self._endpoint_cache
     
     @property
     def is_active(self):
@@ -165,8 +220,9 @@ class ProxyManager(BaseModel):
         return self.regions_data[region].endpoint_urls
     
     def get_randomized_endpoint(self, region: str = None) -> str:
-        return random.choice(self.get_region_endpoints(region)) if region \
-            else random.choice(self.all_endpoints)
+        # Both are cached tuples, so nothing is rebuilt per pick
+        endpoints = self.regions_data[region].endpoint_urls if region else self.all_endpoints
+        return random.choice(endpoints)
 
     @require_boto(is_async = False, required = True)
     def build_endpoints(
@@ -183,19 +239,27 @@ class ProxyManager(BaseModel):
             }
             # logger.info(f'Regions: {self.regions_data}')
         with concurrent.futures.ThreadPoolExecutor(max_workers = get_aiohttpx_settings().num_workers) as executor:
+            # Lists the existing APIs of every region at once
+            api_futures = {
+                region: executor.submit(self.get_apis, region)
+                for region in self.regions_data
+                if not self.regions_data[region].endpoints
+            }
+            for region, future in api_futures.items():
+                self.regions_data[region].filter_endpoints(future.result())
+            self._endpoint_cache = None
+            
+            # Then creates the missing APIs across all regions in one pass
+            futures = []
             for region in self.regions_data:
-                if not self.regions_data[region].endpoints:
-                    self.regions_data[region].filter_endpoints(
-                        self.get_apis(region)
-                    )
                 if self.regions_data[region].endpoints:
-                    logger.info(f"Reusing ({len(self.regions_data[region].endpoints)}) endpoints in {region} for {self.base_url}")
+                    logs.logger.info(f"Reusing ({len(self.regions_data[region].endpoints)}) endpoints in {region} for {self.base_url}")
                 if self.regions_data[region].num_to_create > 0:
-                    logger.info(f"[Sync] Building ({self.regions_data[region].num_to_create}) endpoints in {region} for {self.base_url}")
-                    futures = [
+                    logs.logger.info(f"[Sync] Building ({self.regions_data[region].num_to_create}) endpoints in {region} for {self.base_url}")
+                    futures.extend(
                         executor.submit(self.create_api, region) for _ in range(self.regions_data[region].num_to_create)
-                    ]
-                    _ = [future.result() for future in concurrent.futures.as_completed(futures)]
+                    )
+            _ = [future.result() for future in concurrent.futures.as_completed(futures)]
     
     @require_boto(is_async = True, required = True)
     async def async_build_endpoints(
@@ -212,16 +276,19 @@ class ProxyManager(BaseModel):
                 ) for region in self.regions
             }
             # logger.info(f'Regions: {self.regions_data}')
-        for region in self.regions_data:
+        async def _build_region(region: str):
             if not self.regions_data[region].endpoints:
                 self.regions_data[region].filter_endpoints(
                     await self.async_get_apis(region)
                 )
+                self._endpoint_cache = None
             if self.regions_data[region].endpoints:
-                logger.info(f"Reusing ({len(self.regions_data[region].endpoints)}) endpoints in {region} for {self.base_url}")
+                logs.logger.info(f"Reusing ({len(self.regions_data[region].endpoints)}) endpoints in {region} for {self.base_url}")
             if self.regions_data[region].num_to_create > 0:
-                logger.info(f"[Async] Building ({self.regions_data[region].num_to_create}) endpoints in {region} for {self.base_url}")
+                logs.logger.info(f"[Async] Building ({self.regions_data[region].num_to_create}) endpoints in {region} for {self.base_url}")
                 await asyncio.gather(*[asyncio.create_task(self.async_create_api(region)) for _ in range(self.regions_data[region].num_to_create)])
+        
+        await asyncio.gather(*[_build_region(region) for region in self.regions_data])
                 
     
 
@@ -230,11 +297,65 @@ class ProxyManager(BaseModel):
     """
 
     def get_aws_client(self, region: str):
-        session = BotoSession()
-        return session.client(
-            "apigateway",
-            region_name = region, aws_access_key_id = self.aws_access_key_id, aws_secret_access_key = self.aws_secret_access_key
-        )
+        """
+        Returns the apigateway client for the region, creating it on first use
+        """
+        client = self._region_clients.get(region)
+        if client is None:
+            with self._region_clients_lock:
+                client = self._region_clients.get(region)
+                if client is None:
+                    session = boto.BotoSession()
+                    client = self._region_clients[region] = session.client(
+                        "apigateway",
+                        region_name = region, aws_access_key_id = self.aws_access_key_id, aws_secret_access_key = self.aws_secret_access_key
+                    )
+        return client
+
+    async def async_get_aws_client(self, region: str) -> 'AsyncBotoClient':
+        """
+        Returns the async apigateway client for the region, creating it on first use.
+
+        The pending client is stored before it is awaited, so concurrent
+        callers for the same region share it.
+        """
+        future = self._async_region_clients.get(region)
+        if future is None:
+            if self._async_exit_stack is None:
+                self._async_exit_stack = contextlib.AsyncExitStack()
+            future = asyncio.ensure_future(self._async_exit_stack.enter_async_context(
+                boto.AsyncBotoSession().client(
+                    "apigateway",
+                    region_name = region, aws_access_key_id = self.aws_access_key_id, aws_secret_access_key = self.aws_secret_access_key
+                )
+            ))
+            self._async_region_clients[region] = future
+        try:
+            return await future
+        except Exception:
+            # Retried on the next call rather than caching the failure
+            if self._async_region_clients.get(region) is future:
+                del self._async_region_clients[region]
+            raise
+
+    def close(self) -> None:
+        """
+        Closes the apigateway clients
+        """
+        with self._region_clients_lock:
+            clients = list(self._region_clients.values())
+            self._region_clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """
+        Closes the async apigateway clients
+        """
+        self._async_region_clients.clear()
+        if self._async_exit_stack is not None:
+            stack, self._async_exit_stack = self._async_exit_stack, None
+            await stack.aclose()
 
     """
     Retrieve Endpoints
@@ -253,8 +374,8 @@ class ProxyManager(BaseModel):
                 gateways = client.get_rest_apis(limit=self.pagination_limit) \
                         if position is None \
                         else client.get_rest_apis(limit=self.pagination_limit, position=position)
-            except (ClientError, EndpointConnectionError):
-                logger.error(f"Could not get list of APIs in region \"{region}\"")
+            except (boto.ClientError, boto.EndpointConnectionError):
+                logs.logger.error(f"Could not get list of APIs in region \"{region}\"")
                 return []
             apis.extend(gateways["items"])
             position = gateways.get("position", None)
@@ -268,21 +389,18 @@ class ProxyManager(BaseModel):
         position = None
         complete = False
         apis = []
-        async with AsyncBotoSession().client(
-            "apigateway",
-            region_name = region, aws_access_key_id = self.aws_access_key_id, aws_secret_access_key = self.aws_secret_access_key
-        ) as client:
-            while not complete:
-                try:
-                    gateways = await client.get_rest_apis(limit=self.pagination_limit) \
-                                if position is None \
-                                else await client.get_rest_apis(limit=self.pagination_limit, position=position)
-                except (ClientError, EndpointConnectionError):
-                    logger.error(f"Could not get list of APIs in region \"{region}\"")
-                    return []
-                apis.extend(gateways["items"])
-                position = gateways.get("position", None)
-                if position is None: complete = True
+        client = await self.async_get_aws_client(region)
+        while not complete:
+            try:
+                gateways = await client.get_rest_apis(limit=self.pagination_limit) \
+                            if position is None \
+                            else await client.get_rest_apis(limit=self.pagination_limit, position=position)
+            except (boto.ClientError, boto.EndpointConnectionError):
+                logs.logger.error(f"Could not get list of APIs in region \"{region}\"")
+                return []
+            apis.extend(gateways["items"])
+            position = gateways.get("position", None)
+            if position is None: complete = True
         return apis
     
 
@@ -305,21 +423,22 @@ class ProxyManager(BaseModel):
                 endpointConfiguration = {"types": ["REGIONAL"]})
             )["id"]
 
-        except (ClientError, EndpointConnectionError):
-            logger.error(f"Could not create new API in region \"{region}\"")
+        except (boto.ClientError, boto.EndpointConnectionError):
+            logs.logger.error(f"Could not create new API in region \"{region}\"")
             return None
         
         api_resource_id = (client.get_resources(restApiId=api_id))["items"][0]["id"]
         resource_id = (client.create_resource(restApiId=api_id, parentId=api_resource_id, pathPart="{proxy+}"))["id"]
         
         self.configure_api(client, api_id, api_resource_id, resource_id)
-        logger.info(f"[{region}] Created API with id \"{api_id}\"")
+        logs.logger.info(f"[{region}] Created API with id \"{api_id}\"")
         endpoint = ProxyEndpoint(
             name = name,
             api_id = api_id,
             region = region
         )
         self.regions_data[region].endpoints.append(endpoint)
+        self._endpoints_changed(region)
         return endpoint
 
     async def async_create_api(
@@ -328,84 +447,52 @@ class ProxyManager(BaseModel):
     ) -> typing.Optional[str]:
         # We dont do validation
         # since we assume we've done it already
-        async with AsyncBotoSession().client(
-            "apigateway",
-            region_name = region, aws_access_key_id = self.aws_access_key_id, aws_secret_access_key = self.aws_secret_access_key
-        ) as client:
-            name = self.get_name()
-            try:
-                api_id = (await client.create_rest_api(
-                    name = name, 
-                    endpointConfiguration = {"types": ["REGIONAL"]})
-                )["id"]
-
-            except (ClientError, EndpointConnectionError):
-                logger.error(f"Could not create new API in region \"{region}\"")
-                return None
-            api_resource_id = (await client.get_resources(restApiId=api_id))["items"][0]["id"]
-            resource_id = (await client.create_resource(restApiId=api_id, parentId=api_resource_id, pathPart="{proxy+}"))["id"]
-            
-            await self.async_configure_api(client, api_id, api_resource_id, resource_id)
-            logger.info(f"[{region}] Created API with id \"{api_id}\"")
-            endpoint = ProxyEndpoint(
-                name = name,
-                api_id = api_id,
-                region = region
-            )
-            self.regions_data[region].endpoints.append(endpoint)
-            return endpoint
+        client = await self.async_get_aws_client(region)
+        name = self.get_name()
+        try:
+            api_id = (await client.create_rest_api(
+                name = name, 
+                endpointConfiguration = {"types": ["REGIONAL"]})
+            )["id"]
+
+        except (boto.ClientError, boto.EndpointConnectionError):
+            logs.logger.error(f"Could not create new API in region \"{region}\"")
+            return None
+        api_resource_id = (await client.get_resources(restApiId=api_id))["items"][0]["id"]
+        resource_id = (await client.create_resource(restApiId=api_id, parentId=api_resource_id, pathPart="{proxy+}"))["id"]
+        
+        await self.async_configure_api(client, api_id, api_resource_id, resource_id)
+        logs.logger.info(f"[{region}] Created API with id \"{api_id}\"")
+        endpoint = ProxyEndpoint(
+            name = name,
+            api_id = api_id,
+            region = region
+        )
+        self.regions_data[region].endpoints.append(endpoint)
+        self._endpoints_changed(region)
+        return endpoint
 
     
     """
     Configure Endpoints
     """
 
-    def configure_api(
-        self, 
-        client: typing.Any, 
-        api_id: str, 
-        api_resource_id: str, 
-        resource_id: str
+    def _configure_resource(
+        self,
+        client: typing.Any,
+        api_id: str,
+        resource_id: str,
+        uri: str,
     ) -> None:
-
-        client.put_method(
-            restApiId=api_id,
-            resourceId=api_resource_id,
-            httpMethod="ANY",
-            authorizationType="NONE",
-            requestParameters={
-                "method.request.path.proxy": True,
-                "method.request.header.X-Forwarded-Header": True,
-                "method.request.header.X-Host": True,
-                "method.request.header.X-User-Agent": True,
-            }
-        )
-        client.put_integration(
-            restApiId=api_id,
-            resourceId=api_resource_id,
-            type="HTTP_PROXY",
-            httpMethod="ANY",
-            integrationHttpMethod="ANY",
-            uri=self.uri,
-            connectionType="INTERNET",
-            requestParameters={
-                "integration.request.path.proxy": "method.request.path.proxy",
-                "integration.request.header.X-Forwarded-For": "method.request.header.X-Forwarded-Header",
-                "integration.request.header.Host": "method.request.header.X-Host",
-                "integration.request.header.User-Agent": "method.request.header.X-User-Agent",
-            }
-        )
+        """
+        Adds the proxy method and its integration to the resource
+        """
         client.put_method(
             restApiId=api_id,
             resourceId=resource_id,
             httpMethod="ANY",
             authorizationType="NONE",
-            requestParameters={
-                "method.request.path.proxy": True,
-                "method.request.header.X-Forwarded-Header": True,
-                "method.request.header.X-Host": True,
-                "method.request.header.X-User-Agent": True,
-            }
+            requestParameters=_METHOD_REQUEST_PARAMS,
         )
         client.put_integration(
             restApiId=api_id,
@@ -413,66 +500,43 @@ class ProxyManager(BaseModel):
             type="HTTP_PROXY",
             httpMethod="ANY",
             integrationHttpMethod="ANY",
-            uri=f"{self.uri}/{{proxy}}",
+            uri=uri,
             connectionType="INTERNET",
-            requestParameters={
-                "integration.request.path.proxy": "method.request.path.proxy",
-                "integration.request.header.X-Forwarded-For": "method.request.header.X-Forwarded-Header",
-                "integration.request.header.Host": "method.request.header.X-Host",
-                "integration.request.header.User-Agent": "method.request.header.X-User-Agent",
-            }
-        )
-        client.create_deployment(
-            restApiId=api_id,
-            stageName="proxy-stage"
+            requestParameters=_INTEGRATION_REQUEST_PARAMS,
         )
-    
 
-    async def async_configure_api(
+    def configure_api(
         self, 
-        client: 'AsyncBotoClient', 
+        client: typing.Any, 
         api_id: str, 
         api_resource_id: str, 
         resource_id: str
     ) -> None:
-        await client.put_method(
-            restApiId=api_id,
-            resourceId=api_resource_id,
-            httpMethod="ANY",
-            authorizationType="NONE",
-            requestParameters={
-                "method.request.path.proxy": True,
-                "method.request.header.X-Forwarded-Header": True,
-                "method.request.header.X-Host": True,
-                "method.request.header.X-User-Agent": True,
-            }
-        )
-        await client.put_integration(
+        # Sequential, since API Gateway rejects concurrent
+        # changes to the same API with a `ConflictException`
+        self._configure_resource(client, api_id, api_resource_id, self.uri)
+        self._configure_resource(client, api_id, resource_id, f"{self.uri}/{{proxy}}")
+        client.create_deployment(
             restApiId=api_id,
-            resourceId=api_resource_id,
-            type="HTTP_PROXY",
-            httpMethod="ANY",
-            integrationHttpMethod="ANY",
-            uri=self.uri,
-            connectionType="INTERNET",
-            requestParameters={
-                "integration.request.path.proxy": "method.request.path.proxy",
-                "integration.request.header.X-Forwarded-For": "method.request.header.X-Forwarded-Header",
-                "integration.request.header.Host": "method.request.header.X-Host",
-                "integration.request.header.User-Agent": "method.request.header.X-User-Agent",
-            }
+            stageName="proxy-stage"
         )
+    
+    async def _async_configure_resource(
+        self,
+        client: 'AsyncBotoClient',
+        api_id: str,
+        resource_id: str,
+        uri: str,
+    ) -> None:
+        """
+        Adds the proxy method and its integration to the resource
+        """
         await client.put_method(
             restApiId=api_id,
             resourceId=resource_id,
             httpMethod="ANY",
             authorizationType="NONE",
-            requestParameters={
-                "method.request.path.proxy": True,
-                "method.request.header.X-Forwarded-Header": True,
-                "method.request.header.X-Host": True,
-                "method.request.header.X-User-Agent": True,
-            }
+            requestParameters=_METHOD_REQUEST_PARAMS,
         )
         await client.put_integration(
             restApiId=api_id,
@@ -480,15 +544,22 @@ class ProxyManager(BaseModel):
             type="HTTP_PROXY",
             httpMethod="ANY",
             integrationHttpMethod="ANY",
-            uri=f"{self.uri}/{{proxy}}",
+            uri=uri,
             connectionType="INTERNET",
-            requestParameters={
-                "integration.request.path.proxy": "method.request.path.proxy",
-                "integration.request.header.X-Forwarded-For": "method.request.header.X-Forwarded-Header",
-                "integration.request.header.Host": "method.request.header.X-Host",
-                "integration.request.header.User-Agent": "method.request.header.X-User-Agent",
-            }
+            requestParameters=_INTEGRATION_REQUEST_PARAMS,
         )
+
+    async def async_configure_api(
+        self, 
+        client: 'AsyncBotoClient', 
+        api_id: str, 
+        api_resource_id: str, 
+        resource_id: str
+    ) -> None:
+        # Sequential, since API Gateway rejects concurrent
+        # changes to the same API with a `ConflictException`
+        await self._async_configure_resource(client, api_id, api_resource_id, self.uri)
+        await self._async_configure_resource(client, api_id, resource_id, f"{self.uri}/{{proxy}}")
         await client.create_deployment(
             restApiId=api_id,
             stageName="proxy-stage"
@@ -499,32 +570,58 @@ class ProxyManager(BaseModel):
     Clear Region APIs
     """
 
+    def _handle_deleted_apis(
+        self,
+        region: str,
+        apis: typing.List[ProxyEndpoint],
+        results: typing.List[typing.Any],
+    ) -> bool:
+        """
+        Adds the APIs that could not be deleted back to the region,
+        returning whether any of them were throttled
+        """
+        throttled = False
+        for api, result in zip(apis, results):
+            if not isinstance(result, Exception):
+                logs.logger.info(f"Deleted rest API with id \"{api.api_id}\"")
+                continue
+            # Add it back in if it fails
+            self.regions_data[region].endpoints.append(api)
+            if isinstance(result, boto.ClientError) and result.response["Error"]["Code"] == "TooManyRequestsException":
+                throttled = True
+                continue
+            logs.logger.error(f"Could not delete rest API with id \"{api.api_id}\" in region \"{region}\": {result}")
+        self._endpoints_changed(region)
+        if throttled:
+            logs.logger.error("Too many requests when deleting rest API, sleeping for 3 seconds")
+        return throttled
+
     async def async_clear_region_apis(
         self, 
         region: str,
         force: bool = False,
     ) -> None:
         if not force and self.reuse_gateways:
-            logger.warning(f"Skipping clearing region [{region}] APIs ({len(self.regions_data[region].endpoints)}) because `reuse_gateways` = {self.reuse_gateways} and `force` = {force}")
+            logs.logger.warning(f"Skipping clearing region [{region}] APIs ({len(self.regions_data[region].endpoints)}) because `reuse_gateways` = {self.reuse_gateways} and `force` = {force}")
             return
-        async with AsyncBotoSession().client(
-            "apigateway",
-            region_name=region,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key
-        ) as client:
-            while self.regions_data[region].endpoints:
-                api = self.regions_data[region].endpoints.pop()
-                try:
-                    await client.delete_rest_api(restApiId = api.api_id)
-                except ClientError as e:
-                    # Add it back in if it fails
-                    self.regions_data[region].endpoints.append(api)
-                    if e.response["Error"]["Code"] == "TooManyRequestsException":
-                        logger.error("Too many requests when deleting rest API, sleeping for 3 seconds")
-                        await asyncio.sleep(3.0)
-                        return await self.async_clear_region_apis(region)
-                logger.info(f"Deleted rest API with id \"{api.api_id}\"")
+        client = await self.async_get_aws_client(region)
+        semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+
+        async def delete_rest_api(api: ProxyEndpoint) -> typing.Any:
+            async with semaphore:
+                return await client.delete_rest_api(restApiId = api.api_id)
+
+        # Deletes the region's APIs `_DELETE_CONCURRENCY` at a time, retrying the throttled ones in the loop
+        while self.regions_data[region].endpoints:
+            apis = list(self.regions_data[region].endpoints)
+            self.regions_data[region].endpoints.clear()
+            self._endpoints_changed(region)
+            results = await asyncio.gather(
+                *[delete_rest_api(api) for api in apis], 
+                return_exceptions = True
+            )
+            if not self._handle_deleted_apis(region, apis, results): return
+            await asyncio.sleep(3.0)
     
     def clear_region_apis(
         self, 
@@ -532,21 +629,20 @@ class ProxyManager(BaseModel):
         force: bool = False,
     ) -> None:
         if not force and self.reuse_gateways:
-            logger.warning(f"Skipping clearing region [{region}] APIs ({len(self.regions_data[region].endpoints)}) because `reuse_gateways` = {self.reuse_gateways} and `force` = {force}")
+            logs.logger.warning(f"Skipping clearing region [{region}] APIs ({len(self.regions_data[region].endpoints)}) because `reuse_gateways` = {self.reuse_gateways} and `force` = {force}")
             return
         client = self.get_aws_client(region)
-        while self.regions_data[region].endpoints:
-            api = self.regions_data[region].endpoints.pop()
-            try:
-                client.delete_rest_api(restApiId=api.api_id)
-            except ClientError as e:
-                # Add it back in if it fails
-                self.regions_data[region].endpoints.append(api)
-                if e.response["Error"]["Code"] == "TooManyRequestsException":
-                    logger.error("Too many requests when deleting rest API, sleeping for 3 seconds")
-                    time.sleep(3)
-                    return self.clear_region_apis(region)
-            logger.info(f"Deleted rest API with id \"{api.api_id}\"")
+        # Deletes the region's APIs `_DELETE_CONCURRENCY` at a time, retrying the throttled ones in the loop.
+        # Uses its own executor, since this runs inside the one from `clear_apis`
+        with concurrent.futures.ThreadPoolExecutor(max_workers = _DELETE_CONCURRENCY) as executor:
+            while self.regions_data[region].endpoints:
+                apis = list(self.regions_data[region].endpoints)
+                self.regions_data[region].endpoints.clear()
+                self._endpoints_changed(region)
+                futures = [executor.submit(client.delete_rest_api, restApiId = api.api_id) for api in apis]
+                results = [future.exception() or future.result() for future in futures]
+                if not self._handle_deleted_apis(region, apis, results): return
+                time.sleep(3)
     
     """
     Clear Apis
@@ -556,15 +652,15 @@ class ProxyManager(BaseModel):
         self,
         force: bool = False,
     ) -> None:
-        with concurrent.futures.ThreadPoolExecutor(max_workers = settings.num_workers) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers = get_aiohttpx_settings().num_workers) as executor:
             futures, deleted = [], []
             for region in self.regions_data:
-                logger.info(f"[Sync] Clearing all ({len(self.regions_data[region].endpoints)}) created APIs for region {region}")
+                logs.logger.info(f"[Sync] Clearing all ({len(self.regions_data[region].endpoints)}) created APIs for region {region}")
                 futures.append(
                     executor.submit(self.clear_region_apis, region = region, force = force)
                 )
             deleted.extend(future.result() for future in concurrent.futures.as_completed(futures))
-            logger.info(f"[Sync] All ({len(deleted)}) Regions APIs for ip rotating have been deleted")
+            logs.logger.info(f"[Sync] All ({len(deleted)}) Regions APIs for ip rotating have been deleted")
     
     async def async_clear_apis(
         self,
@@ -572,9 +668,9 @@ class ProxyManager(BaseModel):
     ) -> None:
         tasks = []
         for region in self.regions_data:
-            logger.info(f"[Async] Clearing all ({len(self.regions_data[region].endpoints)}) created APIs for region {region}")
+            logs.logger.info(f"[Async] Clearing all ({len(self.regions_data[region].endpoints)}) created APIs for region {region}")
             tasks.append(
                 asyncio.create_task(self.async_clear_region_apis(region = region, force = force))
             )
         await asyncio.gather(*tasks)
-        logger.info(f"[Async] All ({len(tasks)}) Regions APIs for ip rotating have been deleted")
+        logs.logger.info(f"[Async] All ({len(tasks)}) Regions APIs for ip rotating have been deleted")
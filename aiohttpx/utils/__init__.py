@@ -1,2 +1,21 @@
-from .logs import logger, get_logger
-from .lazy import get_aiohttpx_settings
+import importlib
+
+# Resolved on first access, so importing a single submodule
+# does not load the others
+_LAZY_ATTRS = {
+    'logger': ('aiohttpx.utils.logs', 'logger'),
+    'get_logger': ('aiohttpx.utils.logs', 'get_logger'),
+    'get_aiohttpx_settings': ('aiohttpx.utils.lazy', 'get_aiohttpx_settings'),
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY_ATTRS[name]
+    value = globals()[name] = getattr(importlib.import_module(module), attr)
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,191 @@
+"""
+Conditional GET Response Cache
+"""
+
+import typing
+import datetime
+import httpx
+from collections import OrderedDict
+
+# The cached content is already decoded, so these no longer apply to it
+_STRIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+
+# Always matched like a `Vary` header, so a response is only
+# replayed to requests sent with the same credentials
+_CREDENTIAL_HEADERS = ('authorization', 'cookie')
+
+
+def _is_no_store(headers: httpx.Headers) -> bool:
+    """
+    Checks whether the `Cache-Control` header forbids storing the response
+    """
+    return 'no-store' in headers.get('cache-control', '').lower()
+
+
+class CachedResponse(typing.NamedTuple):
+    """
+    The parts of a response needed to replay it
+    """
+    etag: typing.Optional[str]
+    last_modified: typing.Optional[str]
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    # The `Vary` and credential headers of the request that was sent
+    vary: typing.Tuple[typing.Tuple[str, typing.Optional[str]], ...]
+
+    def conditional_headers(
+        self,
+        headers: typing.Optional[typing.Any] = None
+    ) -> httpx.Headers:
+        """
+        Returns the request headers with the validators added
+        """
+        headers = httpx.Headers(headers)
+        if self.etag: headers['If-None-Match'] = self.etag
+        if self.last_modified: headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def matches(self, request: httpx.Request) -> bool:
+        """
+        Checks whether the sent request has the same `Vary` and credential headers
+        """
+        return all(request.headers.get(name) == value for name, value in self.vary)
+
+
+class ResponseCache:
+    """
+    LRU cache of GET responses that carry an `ETag` or `Last-Modified` header,
+    used to revalidate them with `If-None-Match` / `If-Modified-Since` and
+    replay the cached body on a `304 Not Modified`.
+
+    The cache is per client, so `Cache-Control: private` responses are stored,
+    but only replayed to requests with the same credentials and `Vary` headers.
+    `Cache-Control: no-store` on the request or the response is respected.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._cache: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+
+    @staticmethod
+    def get_key(
+        url: typing.Union[str, httpx.URL],
+        params: typing.Optional[typing.Any] = None,
+        base_url: typing.Optional[typing.Union[str, httpx.URL]] = None,
+        base_params: typing.Optional[typing.Any] = None,
+    ) -> str:
+        """
+        Returns the cache key for the url and params,
+        including the client's base url and params
+        """
+        return f'{base_url or ""}|{httpx.QueryParams(base_params)}|{url}|{httpx.QueryParams(params)}'
+
+    def get(
+        self,
+        key: str,
+        headers: typing.Optional[typing.Any] = None
+    ) -> typing.Optional[CachedResponse]:
+        """
+        Returns the cached response, marking it as recently used.
+
+        Returns `None` if the request headers have `Cache-Control: no-store`
+        """
+        if headers and _is_no_store(httpx.Headers(headers)): return None
+        entry = self._cache.get(key)
+        if entry is not None: self._cache.move_to_end(key)
+        return entry
+
+    def set(self, key: str, response: httpx.Response) -> None:
+        """
+        Caches the response if it has a validator and may be stored
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        vary = [name.strip().lower() for name in response.headers.get('Vary', '').split(',') if name.strip()]
+        if (
+            (not etag and not last_modified)
+            or '*' in vary
+            or _is_no_store(response.headers)
+            or _is_no_store(response.request.headers)
+        ):
+            self._cache.pop(key, None)
+            return
+        headers = httpx.Headers([
+            (name, value) for name, value in response.headers.multi_items()
+            if name not in _STRIPPED_HEADERS
+        ])
+        self._store(key, CachedResponse(
+            etag = etag,
+            last_modified = last_modified,
+            status_code = response.status_code,
+            headers = headers,
+            content = response.content,
+            vary = tuple(
+                (name, response.request.headers.get(name))
+                for name in dict.fromkeys((*vary, *_CREDENTIAL_HEADERS))
+            ),
+        ))
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        """
+        Stores the entry, evicting the least recently used one if full
+        """
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last = False)
+
+    def resolve(
+        self,
+        key: str,
+        entry: typing.Optional[CachedResponse],
+        response: httpx.Response
+    ) -> typing.Optional[httpx.Response]:
+        """
+        Returns the cached response on a `304`, otherwise caches
+        the response if it is successful.
+
+        Returns `None` if the `304` was for a request with different
+        credentials or `Vary` headers than the cached response, in which
+        case the request should be sent again without the validators.
+        """
+        if response.status_code == 304 and entry is not None:
+            if not entry.matches(response.request):
+                self._cache.pop(key, None)
+                return None
+            # The `304` headers update the stored ones
+            updated = {name for name, _ in response.headers.multi_items()}
+            headers = httpx.Headers([
+                *((name, value) for name, value in entry.headers.multi_items() if name not in updated),
+                *((name, value) for name, value in response.headers.multi_items() if name not in _STRIPPED_HEADERS),
+            ])
+            entry = entry._replace(
+                etag = headers.get('ETag'),
+                last_modified = headers.get('Last-Modified'),
+                headers = headers,
+            )
+            self._store(key, entry)
+            cached = httpx.Response(
+                status_code = entry.status_code,
+                headers = entry.headers,
+                content = entry.content,
+                request = response.request,
+                extensions = response.extensions,
+                default_encoding = response.default_encoding,
+            )
+            try:
+                cached.elapsed = response.elapsed
+            except RuntimeError:
+                # Responses that were never streamed, such as from a `MockTransport`
+                cached.elapsed = datetime.timedelta(0)
+            cached.history = response.history
+            return cached
+        if response.status_code == 200: self.set(key, response)
+        return response
+
+    def clear(self) -> None:
+        """
+        Clears the cache
+        """
+        self._cache.clear()
@@ -0,0 +1,223 @@
+"""
+DNS Cache for the httpcore connection pools
+"""
+
+import time
+import socket
+import typing
+import ipaddress
+import threading
+
+import anyio
+import httpx
+import httpcore
+from httpcore._backends.base import (
+    NetworkBackend,
+    AsyncNetworkBackend,
+    NetworkStream,
+    AsyncNetworkStream,
+    SOCKET_OPTION,
+)
+
+_DEFAULT_TTL = 300.0
+
+
+def is_ip_address(host: str) -> bool:
+    """
+    Checks whether the host is already an IP literal
+    """
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class DNSCache:
+    """
+    Caches resolved `(host, port)` -> `[ip, ...]` lookups for `ttl` seconds
+    so that new pool connections to the same host skip the resolver.
+    """
+
+    def __init__(self, ttl: float = _DEFAULT_TTL):
+        self.ttl = ttl
+        self._dns_cache: typing.Dict[typing.Tuple[str, int], typing.Tuple[float, typing.List[str]]] = {}
+
+    def get(self, host: str, port: int) -> typing.Optional[typing.List[str]]:
+        """
+        Returns the cached addresses if they have not expired
+        """
+        entry = self._dns_cache.get((host, port))
+        if entry is None: return None
+        if entry[0] < time.monotonic():
+            self._dns_cache.pop((host, port), None)
+            return None
+        return entry[1]
+
+    def set(self, host: str, port: int, addresses: typing.List[str]) -> None:
+        """
+        Caches the addresses for the host
+        """
+        self._dns_cache[(host, port)] = (time.monotonic() + self.ttl, addresses)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """
+        Removes the cached addresses for the host
+        """
+        self._dns_cache.pop((host, port), None)
+
+    def clear(self) -> None:
+        """
+        Clears the cache
+        """
+        self._dns_cache.clear()
+
+    @staticmethod
+    def _getaddrinfo(host: str, port: int) -> typing.List[str]:
+        """
+        Resolves the host, preserving the resolver's ordering
+        """
+        try:
+            infos = socket.getaddrinfo(host, port, type = socket.SOCK_STREAM)
+        except OSError as e:
+            raise httpcore.ConnectError(e) from e
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+    def resolve(self, host: str, port: int) -> typing.List[str]:
+        """
+        Resolves the host, using the cache if available
+        """
+        addresses = self.get(host, port)
+        if addresses is None:
+            addresses = self._getaddrinfo(host, port)
+            self.set(host, port, addresses)
+        return addresses
+
+    async def async_resolve(self, host: str, port: int) -> typing.List[str]:
+        """
+        Resolves the host in a worker thread, using the cache if available
+        """
+        addresses = self.get(host, port)
+        if addresses is None:
+            addresses = await anyio.to_thread.run_sync(self._getaddrinfo, host, port)
+            self.set(host, port, addresses)
+        return addresses
+
+
+class CachingNetworkBackend(NetworkBackend):
+    """
+    Wraps a sync network backend to connect to cached addresses
+    """
+
+    def __init__(self, backend: NetworkBackend, cache: DNSCache):
+        self._backend = backend
+        self._cache = cache
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: typing.Optional[float] = None,
+        local_address: typing.Optional[str] = None,
+        socket_options: typing.Optional[typing.Iterable[SOCKET_OPTION]] = None,
+    ) -> NetworkStream:
+        if is_ip_address(host):
+            return self._backend.connect_tcp(host, port, timeout = timeout, local_address = local_address, socket_options = socket_options)
+        error = None
+        for address in self._cache.resolve(host, port):
+            try:
+                return self._backend.connect_tcp(address, port, timeout = timeout, local_address = local_address, socket_options = socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        # All of the cached addresses failed, so resolve again next time
+        self._cache.invalidate(host, port)
+        if error is None: raise httpcore.ConnectError(f"No addresses found for {host}:{port}")
+        raise error
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: typing.Optional[float] = None,
+        socket_options: typing.Optional[typing.Iterable[SOCKET_OPTION]] = None,
+    ) -> NetworkStream:
+        return self._backend.connect_unix_socket(path, timeout = timeout, socket_options = socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        return self._backend.sleep(seconds)
+
+
+class AsyncCachingNetworkBackend(AsyncNetworkBackend):
+    """
+    Wraps an async network backend to connect to cached addresses
+    """
+
+    def __init__(self, backend: AsyncNetworkBackend, cache: DNSCache):
+        self._backend = backend
+        self._cache = cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: typing.Optional[float] = None,
+        local_address: typing.Optional[str] = None,
+        socket_options: typing.Optional[typing.Iterable[SOCKET_OPTION]] = None,
+    ) -> AsyncNetworkStream:
+        if is_ip_address(host):
+            return await self._backend.connect_tcp(host, port, timeout = timeout, local_address = local_address, socket_options = socket_options)
+        error = None
+        for address in await self._cache.async_resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(address, port, timeout = timeout, local_address = local_address, socket_options = socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        # All of the cached addresses failed, so resolve again next time
+        self._cache.invalidate(host, port)
+        if error is None: raise httpcore.ConnectError(f"No addresses found for {host}:{port}")
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: typing.Optional[float] = None,
+        socket_options: typing.Optional[typing.Iterable[SOCKET_OPTION]] = None,
+    ) -> AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout = timeout, socket_options = socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        return await self._backend.sleep(seconds)
+
+
+def install_dns_cache(
+    client: typing.Union[httpx.Client, httpx.AsyncClient],
+    cache: DNSCache,
+) -> None:
+    """
+    Wraps the network backend of the client's connection pools with the cache.
+
+    Transports that are not backed by a httpcore pool (such as mocks or apps)
+    are left untouched. TLS still uses the original hostname for SNI and
+    certificate validation.
+    """
+    wrapper = AsyncCachingNetworkBackend if isinstance(client, httpx.AsyncClient) else CachingNetworkBackend
+    for transport in (client._transport, *client._mounts.values()):
+        pool = getattr(transport, '_pool', None)
+        if pool is None or isinstance(pool._network_backend, wrapper): continue
+        pool._network_backend = wrapper(pool._network_backend, cache)
+
+
+_dns_caches: typing.Dict[float, DNSCache] = {}
+_dns_cache_lock = threading.Lock()
+
+def get_dns_cache(ttl: typing.Optional[float] = None) -> DNSCache:
+    """
+    Returns the process-wide DNS cache for the ttl
+    """
+    if ttl is None: ttl = _DEFAULT_TTL
+    cache = _dns_caches.get(ttl)
+    if cache is None:
+        with _dns_cache_lock:
+            cache = _dns_caches.get(ttl)
+            if cache is None:
+                cache = _dns_caches[ttl] = DNSCache(ttl = ttl)
+    return cache
@@ -2,21 +2,35 @@ import asyncio
 import inspect
 from typing import Coroutine
 
+def _is_coro_callable(obj, func_name: str = None) -> bool:
+    """
+    Checks the function, the named method and `__call__`,
+    short-circuiting on the first match
+    """
+    return bool(
+        inspect.iscoroutinefunction(obj)
+        or (func_name and inspect.iscoroutinefunction(getattr(obj, func_name, None)))
+        or (callable(obj) and inspect.iscoroutinefunction(obj.__call__))
+    )
+
 def is_coro_func(obj, func_name: str = None):
     """
     This is probably in the library elsewhere but returns bool
     based on if the function is a coro
     """
     try:
-        if inspect.iscoroutinefunction(obj): return True
+        # `async def` functions and bound methods only need their code flags checked
+        code = getattr(obj, '__code__', None)
+        if code is not None and code.co_flags & inspect.CO_COROUTINE: return True
         if inspect.isawaitable(obj): return True
-        if func_name and hasattr(obj, func_name) and inspect.iscoroutinefunction(getattr(obj, func_name)):
-            return True
-        return bool(hasattr(obj, '__call__') and inspect.iscoroutinefunction(obj.__call__))
+        return _is_coro_callable(obj, func_name)
 
     except Exception:
         return False
 
+# Strong references to the running background tasks. The event loop only keeps
+# weak references to tasks, so a `WeakSet` here would let a task be garbage
+# collected before it finishes. Each task removes itself once it is done.
 background_tasks = set()
 
 def run_in_background(coro: Coroutine):
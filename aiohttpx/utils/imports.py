@@ -4,27 +4,52 @@ Base Import Handler
 import sys
 import typing
 import functools
-import importlib
-import subprocess
+import importlib.util
 from types import ModuleType
 
-from .logs import logger
+from . import logs
 from .helpers import is_coro_func
 
+def _normalize_dist_name(name: str) -> str:
+    # Distribution names compare case-insensitively, with '-', '_' and '.' equivalent
+    return name.lower().replace('-', '_').replace('.', '_')
+
+@functools.lru_cache(maxsize = 1)
+def _installed_names() -> typing.FrozenSet[str]:
+    """
+    Returns the normalized names of every installed distribution,
+    collected in a single pass over the metadata
+    """
+    # Imported here, since the metadata machinery is only needed on this path
+    try:
+        from importlib.metadata import distributions
+        names = (dist.metadata['Name'] for dist in distributions())
+    except ImportError:
+        # Python 3.7
+        import pkg_resources
+        names = (dist.project_name for dist in pkg_resources.working_set)
+    return frozenset(_normalize_dist_name(name) for name in names if name)
+
 def is_lib_available(library: str) -> bool:
     """ Checks whether a Python Library is available."""
-    import pkg_resources
     if library == 'colab': library = 'google.colab'
+    # The import system caches its finders, so this is cheaper than the metadata scan
     try:
-        _ = pkg_resources.get_distribution(library)
-        return True
-    except pkg_resources.DistributionNotFound: return False
+        if importlib.util.find_spec(library) is not None: return True
+    except (ValueError, ModuleNotFoundError):
+        pass
+    # Distributions whose name differs from their module, such as `fusepy`
+    return _normalize_dist_name(library) in _installed_names()
+
+# Strips the version comparison characters in a single pass
+_VERSION_CHARS = str.maketrans('', '', '<>')
 
+@functools.lru_cache(maxsize = 256)
 def get_lib_requirement(name: str, clean: bool = True) -> str:
     # Replaces '-' with '_'
     # for any library such as tensorflow-text -> tensorflow_text
     name = name.replace('-', '_')
-    return name.split('=')[0].replace('>', '').replace('<', '').strip() if clean else name.strip()
+    return name.split('=')[0].translate(_VERSION_CHARS).strip() if clean else name.strip()
 
 
 def is_imported(library: str) -> bool:
@@ -33,21 +58,88 @@ def is_imported(library: str) -> bool:
 
 def ensure_lib_imported(library: str):
     clean_lib = get_lib_requirement(library, True)
-    if not is_imported(clean_lib): sys.modules[clean_lib] = importlib.import_module(clean_lib)
-    return sys.modules[clean_lib]
+    # Already imported libraries are returned with a single lookup
+    module = sys.modules.get(clean_lib)
+    if module is not None: return module
+    # `import_module` registers the module in `sys.modules` itself
+    return importlib.import_module(clean_lib)
 
-def install_library(library: str, upgrade: bool = True, verbose: bool = False):
+def _run_pip_install(
+    libraries: typing.List[str], 
+    upgrade: bool = True, 
+    verbose: bool = False,
+    binary_only: bool = True,
+    no_deps: bool = False,
+):
     """
-    Install the library
+    Runs a single pip install for the libraries
     """
+    # Only needed on the rare missing dependency path
+    import subprocess
     pip_exec = [sys.executable, '-m', 'pip', 'install']
-    msg = f"Installing {library}"
-    if '=' not in library or upgrade: 
+    msg = f"Installing {', '.join(libraries)}"
+    if upgrade or any('=' not in library for library in libraries):
         pip_exec.append('--upgrade')
         msg += ' (upgrade=True)'
-    if verbose: logger.info(msg)
-    pip_exec.append(library)
-    return subprocess.check_call(pip_exec, stdout=subprocess.DEVNULL)
+    if no_deps: pip_exec.append('--no-deps')
+    if verbose: logs.logger.info(msg)
+    pip_exec.extend(libraries)
+    if binary_only:
+        # Wheels skip building from source, but not every library has them
+        try:
+            result = subprocess.check_call(pip_exec[:4] + ['--only-binary=:all:'] + pip_exec[4:], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except subprocess.CalledProcessError:
+            result = subprocess.check_call(pip_exec, stdout=subprocess.DEVNULL)
+    else:
+        result = subprocess.check_call(pip_exec, stdout=subprocess.DEVNULL)
+    # The installed libraries would otherwise still be cached as missing
+    _installed_names.cache_clear()
+    return result
+
+def install_library(
+    library: str, 
+    upgrade: bool = True, 
+    verbose: bool = False,
+    binary_only: bool = True,
+    no_deps: bool = False,
+):
+    """
+    Install the library
+
+    Prefers wheels when `binary_only`, falling back to a regular install
+    if the library has none. `no_deps` skips installing its dependencies.
+    """
+    return _run_pip_install([library], upgrade = upgrade, verbose = verbose, binary_only = binary_only, no_deps = no_deps)
+
+def install_libraries(
+    libraries: typing.List[str], 
+    upgrade: bool = True, 
+    verbose: bool = False,
+    binary_only: bool = True,
+    no_deps: bool = False,
+):
+    """
+    Install the libraries with a single pip call
+    """
+    return _run_pip_install(libraries, upgrade = upgrade, verbose = verbose, binary_only = binary_only, no_deps = no_deps)
+
+def install_libraries_ordered(
+    chunks: typing.List[typing.List[str]], 
+    upgrade: bool = True, 
+    verbose: bool = False,
+    binary_only: bool = True,
+    no_deps: bool = False,
+):
+    """
+    Install the chunks of libraries in order, with a single pip call per chunk
+
+    The libraries within a chunk are installed together, so anything that
+    must be installed before other libraries should be in an earlier chunk.
+    """
+    return [
+        _run_pip_install(chunk, upgrade = upgrade, verbose = verbose, binary_only = binary_only, no_deps = no_deps)
+        for chunk in chunks if chunk
+    ]
 
 def import_lib(
     library: str, 
@@ -93,9 +185,15 @@ def resolve_missing(
     elif packages is None:
         packages = modules
     kind = 'required' if required else 'optionally required'
-    logger.info(f"{', '.join(modules)} are {kind}. Installing...")
-    for module, pkg in zip(modules, packages):
-        import_lib(module, pkg)
+    logs.logger.info(f"{', '.join(modules)} are {kind}. Installing...")
+    # Installs everything that is missing in one pip call, rather than one per package
+    missing = [
+        pkg for module, pkg in zip(modules, packages)
+        if not is_lib_available(get_lib_requirement(module, True))
+    ]
+    if missing: install_libraries(missing, upgrade = False)
+    for module in modules:
+        ensure_lib_imported(module)
 
 
 def resolve_missing_custom(
@@ -116,12 +214,22 @@ def resolve_missing_custom(
     
     module_names = [module.split(' ', 1)[0] for module in modules]
     kind = 'required' if required else 'optionally required'
-    logger.info(f"{', '.join(module_names)} are {kind}. Installing...")
+    logs.logger.info(f"{', '.join(module_names)} are {kind}. Installing...")
+    # Consecutive packages that share the same pip options (such as an extra index)
+    # are installed with one pip call, while the chunks still install in order.
+    # The chunks are not run concurrently, since pip processes write to the
+    # same site-packages without any locking, and can leave it inconsistent
+    partitions: typing.List[typing.Tuple[typing.List[str], typing.List[str]]] = []
     for module, pkg in zip(modules, packages):
         module_name = get_lib_requirement(module, True)
         if is_lib_available(module_name):
             continue
-        install_library(pkg)
+        pkg_name, _, options = pkg.partition(' ')
+        options = options.split()
+        if not partitions or partitions[-1][1] != options:
+            partitions.append(([], options))
+        partitions[-1][0].append(pkg_name)
+    install_libraries_ordered([names + options for names, options in partitions])
 
     
 def require_missing_wrapper(
@@ -132,15 +240,22 @@ def require_missing_wrapper(
     """
     Helper function to wrap the resolve async or sync funcs
     """
+    # Bound once, rather than unpacking the kwargs on every call
+    bound_resolver = functools.partial(resolver, **resolver_kwargs) if resolver_kwargs else resolver
     if is_coro_func(func):
-        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            resolver(**resolver_kwargs)
+            bound_resolver()
             return await func(*args, **kwargs)
     else:
-        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            resolver(**resolver_kwargs)
+            bound_resolver()
             return func(*args, **kwargs)
 
+    # Only the identifying attributes are copied, rather than everything
+    # `functools.wraps` copies, since many wrappers can be built at import time
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
     return wrapper
\ No newline at end of file
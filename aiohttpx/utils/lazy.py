@@ -2,6 +2,7 @@
 Lazy Imports
 """
 
+import threading
 from typing import Optional, TYPE_CHECKING
 
 
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
 
 
 _aiohttpx_settings: Optional["AiohttpxSettings"] = None
+_aiohttpx_settings_lock = threading.Lock()
 
 def get_aiohttpx_settings() -> "AiohttpxSettings":
     """
@@ -18,7 +20,10 @@ def get_aiohttpx_settings() -> "AiohttpxSettings":
     global _aiohttpx_settings
 
     if _aiohttpx_settings is None:
-        from aiohttpx.configs.base import AiohttpxSettings
-        _aiohttpx_settings = AiohttpxSettings()
+        with _aiohttpx_settings_lock:
+            # Check if another thread beat us to it.
+            if _aiohttpx_settings is None:
+                from aiohttpx.configs.base import AiohttpxSettings
+                _aiohttpx_settings = AiohttpxSettings()
 
     return _aiohttpx_settings
\ No newline at end of file
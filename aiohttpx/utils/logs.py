@@ -3,23 +3,31 @@ import logging
 from typing import Optional
 
 _logger: Optional[logging.Logger] = None
-_muted_httpx: Optional[bool] = None
+_muted_httpx: bool = False
+
+# Read once, so `LOG_LEVEL` is only checked when `LOGGER_LEVEL` is unset
+_DEFAULT_LEVEL: str = os.environ.get("LOGGER_LEVEL") or os.environ.get("LOG_LEVEL") or "INFO"
+
+# Shared by every handler, rather than built each time a logger is created
+_FORMATTER = logging.Formatter("%(levelname)-8s %(asctime)s %(filename)s:%(lineno)s: %(message)s", "%Y-%m-%d %H:%M:%S")
 
 def get_logger(level: Optional[str] = None) -> logging.Logger:
     """
     Get a logger instance.
     """
     global _logger
-    if _logger is not None:
-        return _logger
-    if level is None: level = os.getenv("LOGGER_LEVEL", os.getenv("LOG_LEVEL", "INFO"))
-    logger = logging.getLogger(__name__)
-    logger.setLevel(level)
-    if not logger.hasHandlers():
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(levelname)-8s %(asctime)s %(filename)s:%(lineno)s: %(message)s", "%Y-%m-%d %H:%M:%S"))
-        logger.addHandler(handler)
-        # logger.propagate = False
+    logger = _logger
+    if logger is None:
+        logger = logging.getLogger(__name__)
+        logger.setLevel(level or _DEFAULT_LEVEL)
+        if not logger.hasHandlers():
+            handler = logging.StreamHandler()
+            handler.setFormatter(_FORMATTER)
+            logger.addHandler(handler)
+            # logger.propagate = False
+        _logger = logger
+    # Only an explicit `level` changes the level of the existing logger
+    elif level: logger.setLevel(level)
     return logger
 
 def mute_httpx_logger() -> None:
@@ -27,10 +35,17 @@ def mute_httpx_logger() -> None:
     Mute the httpx logger.
     """
     global _muted_httpx
-    if _muted_httpx is not None:
-        return
-    _muted_httpx = True
+    if _muted_httpx: return
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    _muted_httpx = True
 
 
-logger: logging.Logger = get_logger()
\ No newline at end of file
+def __getattr__(name: str):
+    """
+    Creates the `logger` on first access rather than at import
+    """
+    if name == 'logger':
+        # Keeps the level of a logger already created by `get_logger`
+        logger = globals()['logger'] = _logger if _logger is not None else get_logger()
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
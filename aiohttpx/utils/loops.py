@@ -0,0 +1,45 @@
+"""
+Event Loop Policies
+"""
+
+import os
+import sys
+import typing
+import asyncio
+from importlib.util import find_spec
+
+from . import logs
+
+# None until the first attempt, so a missing library is only logged once
+_loop_policy_installed: typing.Optional[bool] = None
+
+def install_event_loop_policy() -> bool:
+    """
+    Installs the `uvloop` (or `winloop` on Windows) event loop policy
+    if it is available.
+
+    This changes the policy for the whole process, and only applies to
+    event loops created afterwards, so it should be called once at startup,
+    before `asyncio.run` or any loop is started. It is called on import
+    if `AIOHTTPX_USE_UVLOOP` is set.
+
+    On Python 3.12+, passing `loop_factory = uvloop.new_event_loop` to
+    `asyncio.Runner` avoids the policy API, which is deprecated in 3.14.
+
+    Returns whether the policy was installed.
+    """
+    global _loop_policy_installed
+    if _loop_policy_installed is not None: return _loop_policy_installed
+    lib = 'winloop' if sys.platform == 'win32' else 'uvloop'
+    if find_spec(lib) is None: 
+        logs.logger.warning(f"{lib} is not installed, using the default event loop")
+        _loop_policy_installed = False
+        return False
+    module = __import__(lib)
+    asyncio.set_event_loop_policy(module.EventLoopPolicy())
+    _loop_policy_installed = True
+    return True
+
+# Opt-in, since the policy applies to every loop the process creates afterwards
+if os.getenv('AIOHTTPX_USE_UVLOOP', '').lower() in {'1', 'true', 'yes', 'on'}:
+    install_event_loop_policy()
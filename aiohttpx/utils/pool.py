@@ -0,0 +1,142 @@
+"""
+Process-wide connection pools shared between clients
+"""
+
+import typing
+import asyncio
+import weakref
+import threading
+
+import httpx
+
+
+# The client kwargs that configure the connection pool itself
+_POOL_KWARGS = ('verify', 'cert', 'http1', 'http2', 'limits', 'trust_env')
+
+# Clients with any of these set bring their own transports
+_CUSTOM_TRANSPORT_KWARGS = ('transport', 'app', 'proxies', 'proxy')
+
+
+def get_pool_key(kwargs: typing.Dict[str, typing.Any]) -> typing.Optional[typing.Tuple]:
+    """
+    Returns the key of the shared pool for the client kwargs, or `None`
+    if the client cannot use a shared pool
+    """
+    if any(kwargs.get(name) is not None for name in _CUSTOM_TRANSPORT_KWARGS): return None
+    key = []
+    for name in _POOL_KWARGS:
+        value = kwargs.get(name)
+        # `httpx.Limits` is not hashable
+        if isinstance(value, httpx.Limits):
+            value = (value.max_connections, value.max_keepalive_connections, value.keepalive_expiry)
+        key.append(value)
+    return tuple(key)
+
+
+def _build_transport_kwargs(kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """
+    Returns the kwargs for the transport from the client kwargs
+    """
+    return {name: kwargs[name] for name in _POOL_KWARGS if kwargs.get(name) is not None}
+
+
+class SharedTransport(httpx.BaseTransport):
+    """
+    A reference counted sync transport shared between clients.
+
+    The pool is only closed once the last client using it is closed.
+    """
+
+    def __init__(self, key: typing.Tuple, transport: httpx.HTTPTransport):
+        self._key = key
+        self._transport = transport
+        # Exposed so that the DNS cache can be installed on the pool
+        self._pool = transport._pool
+        self._refs = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        with _shared_lock:
+            self._refs -= 1
+            if self._refs > 0: return
+            if _shared_transports.get(self._key) is self:
+                _shared_transports.pop(self._key)
+        self._transport.close()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """
+    A reference counted async transport shared between the clients
+    of an event loop.
+
+    The pool is only closed once the last client using it is closed.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, key: typing.Tuple, transport: httpx.AsyncHTTPTransport):
+        # Weak, since the transports are stored by their loop
+        self._loop_ref = weakref.ref(loop)
+        self._key = key
+        self._transport = transport
+        # Exposed so that the DNS cache can be installed on the pool
+        self._pool = transport._pool
+        self._refs = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with _shared_lock:
+            self._refs -= 1
+            if self._refs > 0: return
+            loop = self._loop_ref()
+            transports = _async_shared_transports.get(loop) if loop is not None else None
+            if transports is not None and transports.get(self._key) is self:
+                transports.pop(self._key)
+                if not transports: _async_shared_transports.pop(loop)
+        await self._transport.aclose()
+
+
+_shared_transports: typing.Dict[typing.Tuple, SharedTransport] = {}
+# The async pools are bound to the event loop they are first used on,
+# so they are only shared between the clients of the same loop
+_async_shared_transports: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, typing.Dict[typing.Tuple, AsyncSharedTransport]]' = weakref.WeakKeyDictionary()
+_shared_lock = threading.Lock()
+
+
+def acquire_shared_transport(key: typing.Tuple, kwargs: typing.Dict[str, typing.Any]) -> SharedTransport:
+    """
+    Returns the shared sync transport for the key, creating it on first use
+    """
+    with _shared_lock:
+        transport = _shared_transports.get(key)
+        if transport is None:
+            transport = SharedTransport(key, httpx.HTTPTransport(**_build_transport_kwargs(kwargs)))
+            _shared_transports[key] = transport
+        transport._refs += 1
+    return transport
+
+
+def acquire_async_shared_transport(key: typing.Tuple, kwargs: typing.Dict[str, typing.Any]) -> typing.Optional[AsyncSharedTransport]:
+    """
+    Returns the shared async transport for the key in the running event loop,
+    creating it on first use.
+
+    Returns `None` outside of a running event loop, since the loop
+    the transport will be used on is not known yet.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    with _shared_lock:
+        transports = _async_shared_transports.get(loop)
+        if transports is None:
+            transports = _async_shared_transports[loop] = {}
+        transport = transports.get(key)
+        if transport is None:
+            transport = AsyncSharedTransport(loop, key, httpx.AsyncHTTPTransport(**_build_transport_kwargs(kwargs)))
+            transports[key] = transport
+        transport._refs += 1
+    return transport
@@ -1,3 +1,4 @@
+import re
 import sys
 from pathlib import Path
 from setuptools import setup, find_packages
@@ -9,7 +10,10 @@ pkg_name = 'aiohttpx'
 gitrepo = 'GrowthEngineAI/aiohttpx'
 
 root = Path(__file__).parent
-version = root.joinpath('aiohttpx/version.py').read_text().split('VERSION = ', 1)[-1].strip().replace('-', '').replace("'", '')
+version = re.search(
+    r"""VERSION\s*=\s*['"]([^'"]+)['"]""",
+    root.joinpath('aiohttpx/version.py').read_text()
+).group(1).replace('-', '')
 
 requirements = [
     'httpx',
@@ -23,6 +27,9 @@ if sys.version_info.minor < 8:
 
 extras = {
     'cli': ['typer'],
+    'http2': ['h2'],
+    'soup': ['beautifulsoup4', 'lxml'],
+    'uvloop': ["uvloop; sys_platform != 'win32'", "winloop; sys_platform == 'win32'"],
 }
 
 args = {
@@ -0,0 +1,38 @@
+import asyncio
+import httpx
+import pytest
+import aiohttpx
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == '/error':
+        raise httpx.ConnectError('failed', request = request)
+    return httpx.Response(200, json = {'method': request.method, 'path': request.url.path})
+
+
+def get_client() -> aiohttpx.Client:
+    transport = httpx.MockTransport(handler)
+    return aiohttpx.Client(base_url = 'https://example.org', transport = transport)
+
+
+def test_bulk_request():
+    responses = get_client().bulk_request([('GET', '/a'), ('POST', '/b', {'json': {}}), ('GET', '/error')], concurrency = 2)
+    assert responses[0].json() == {'method': 'GET', 'path': '/a'}
+    assert responses[1].json() == {'method': 'POST', 'path': '/b'}
+    assert isinstance(responses[2], httpx.ConnectError)
+
+
+def test_async_request_many():
+    responses = asyncio.run(get_client().async_get_many(['/a', '/error', '/b'], concurrency = 1))
+    assert [r.json()['path'] for r in (responses[0], responses[2])] == ['/a', '/b']
+    assert isinstance(responses[1], httpx.ConnectError)
+
+
+def test_bulk_rejects_invalid_concurrency():
+    client = get_client()
+    with pytest.raises(ValueError):
+        client.bulk_request([('GET', '/a')], concurrency = 0)
+    with pytest.raises(ValueError):
+        asyncio.run(client.async_bulk_request([('GET', '/a')], concurrency = 0))
+    with pytest.raises(ValueError):
+        asyncio.run(client.async_request_many('GET', ['/a'], concurrency = 0))
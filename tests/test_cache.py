@@ -0,0 +1,82 @@
+import asyncio
+import httpx
+import aiohttpx
+
+
+class Server:
+    """
+    Serves a single resource, answering `304` when the `ETag` matches
+    """
+
+    def __init__(self, headers: dict = None):
+        self.headers = {'ETag': '"v1"', 'Vary': 'Accept', **(headers or {})}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get('If-None-Match') == self.headers['ETag']:
+            return httpx.Response(304, headers = {'ETag': self.headers['ETag'], 'X-Revalidated': 'yes'})
+        return httpx.Response(200, headers = self.headers, content = b'body')
+
+
+def test_cache_hit():
+    server = Server()
+    client = aiohttpx.Client(base_url = 'https://example.org', transport = httpx.MockTransport(server), cache = True)
+    first = client.get('/resource')
+    second = client.get('/resource')
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+    assert second.status_code == 200
+    assert second.content == first.content == b'body'
+    assert second.elapsed is not None
+    assert second.request is server.requests[1]
+
+
+def test_cache_hit_async():
+    server = Server()
+    async def run():
+        async with aiohttpx.Client(base_url = 'https://example.org', transport = httpx.MockTransport(server), cache = True) as client:
+            await client.async_get('/resource')
+            return await client.async_get('/resource')
+
+    response = asyncio.run(run())
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+    assert response.content == b'body'
+
+
+def test_cache_revalidation_merges_headers():
+    server = Server()
+    client = aiohttpx.Client(base_url = 'https://example.org', transport = httpx.MockTransport(server), cache = True)
+    client.get('/resource')
+    response = client.get('/resource')
+    assert response.headers['X-Revalidated'] == 'yes'
+    assert response.headers['Vary'] == 'Accept'
+    # The merged headers are kept for the next revalidation
+    assert client.get('/resource').headers['X-Revalidated'] == 'yes'
+
+
+def test_cache_key_includes_base_url():
+    server = Server()
+    client = aiohttpx.Client(base_url = 'https://example.org/a', transport = httpx.MockTransport(server), cache = True)
+    client.get('/resource')
+    client.base_url = 'https://example.org/b'
+    client.get('/resource')
+    assert 'If-None-Match' not in server.requests[1].headers
+
+
+def test_cache_no_store():
+    server = Server({'Cache-Control': 'no-store'})
+    client = aiohttpx.Client(base_url = 'https://example.org', transport = httpx.MockTransport(server), cache = True)
+    client.get('/resource')
+    client.get('/resource')
+    assert 'If-None-Match' not in server.requests[1].headers
+
+
+def test_cache_not_replayed_across_credentials():
+    server = Server()
+    client = aiohttpx.Client(base_url = 'https://example.org', transport = httpx.MockTransport(server), cache = True)
+    client.get('/resource', headers = {'Authorization': 'Bearer a'})
+    response = client.get('/resource', headers = {'Authorization': 'Bearer b'})
+    assert response.status_code == 200
+    # The `304` for the other credentials is not used, and the request is sent again
+    assert len(server.requests) == 3
+    assert 'If-None-Match' not in server.requests[2].headers
@@ -0,0 +1,91 @@
+import asyncio
+import httpcore
+import pytest
+
+from aiohttpx.utils import dns
+
+
+class FakeBackend:
+    """
+    Records the addresses that are connected to
+    """
+
+    def __init__(self):
+        self.connected = []
+
+    def connect_tcp(self, host, port, **kwargs):
+        self.connected.append(host)
+        return host
+
+
+class AsyncFakeBackend(FakeBackend):
+
+    async def connect_tcp(self, host, port, **kwargs):
+        return super().connect_tcp(host, port, **kwargs)
+
+
+def resolver(addresses):
+    calls = []
+    def getaddrinfo(host, port):
+        calls.append((host, port))
+        return list(addresses)
+    return getaddrinfo, calls
+
+
+def test_dns_cache_hit(monkeypatch):
+    cache = dns.DNSCache(ttl = 60)
+    getaddrinfo, calls = resolver(['10.0.0.1'])
+    monkeypatch.setattr(cache, '_getaddrinfo', getaddrinfo)
+    assert cache.resolve('example.org', 443) == ['10.0.0.1']
+    assert cache.resolve('example.org', 443) == ['10.0.0.1']
+    assert len(calls) == 1
+
+
+def test_dns_cache_expiry(monkeypatch):
+    cache = dns.DNSCache(ttl = 60)
+    getaddrinfo, calls = resolver(['10.0.0.1'])
+    monkeypatch.setattr(cache, '_getaddrinfo', getaddrinfo)
+    now = [1000.0]
+    monkeypatch.setattr(dns.time, 'monotonic', lambda: now[0])
+    cache.resolve('example.org', 443)
+    now[0] += 59
+    cache.resolve('example.org', 443)
+    assert len(calls) == 1
+    now[0] += 2
+    cache.resolve('example.org', 443)
+    assert len(calls) == 2
+
+
+def test_dns_cache_empty_result(monkeypatch):
+    cache = dns.DNSCache(ttl = 60)
+    getaddrinfo, _ = resolver([])
+    monkeypatch.setattr(cache, '_getaddrinfo', getaddrinfo)
+    backend = FakeBackend()
+    with pytest.raises(httpcore.ConnectError):
+        dns.CachingNetworkBackend(backend, cache).connect_tcp('example.org', 443)
+    assert cache.get('example.org', 443) is None
+    assert backend.connected == []
+
+
+def test_dns_cache_empty_result_async(monkeypatch):
+    cache = dns.DNSCache(ttl = 60)
+    getaddrinfo, _ = resolver([])
+    monkeypatch.setattr(cache, '_getaddrinfo', getaddrinfo)
+    backend = dns.AsyncCachingNetworkBackend(AsyncFakeBackend(), cache)
+    with pytest.raises(httpcore.ConnectError):
+        asyncio.run(backend.connect_tcp('example.org', 443))
+
+
+def test_dns_cache_connects_to_cached_address(monkeypatch):
+    cache = dns.DNSCache(ttl = 60)
+    getaddrinfo, _ = resolver(['10.0.0.1'])
+    monkeypatch.setattr(cache, '_getaddrinfo', getaddrinfo)
+    backend = FakeBackend()
+    dns.CachingNetworkBackend(backend, cache).connect_tcp('example.org', 443)
+    assert backend.connected == ['10.0.0.1']
+
+
+def test_get_dns_cache_per_ttl():
+    assert dns.get_dns_cache(10).ttl == 10
+    assert dns.get_dns_cache(20).ttl == 20
+    assert dns.get_dns_cache(10) is dns.get_dns_cache(10)
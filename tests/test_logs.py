@@ -0,0 +1,12 @@
+import logging
+from aiohttpx.utils.logs import get_logger
+
+
+def test_get_logger_keeps_level():
+    logger = get_logger('DEBUG')
+    try:
+        assert get_logger() is logger
+        assert logger.level == logging.DEBUG
+        assert get_logger('WARNING').level == logging.WARNING
+    finally:
+        get_logger('INFO')
@@ -0,0 +1,45 @@
+import asyncio
+import httpx
+import aiohttpx
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json = {'url': str(request.url)})
+
+
+def test_async_uses_sync_transport():
+    # The async client falls back to the sync transport if `async_transport` is unset
+    async def run():
+        async with aiohttpx.Client(transport = httpx.MockTransport(handler)) as client:
+            return await client.async_get('https://example.org/get')
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert response.json() == {'url': 'https://example.org/get'}
+
+
+def test_async_uses_sync_event_hooks():
+    called = []
+    async def on_response(response: httpx.Response):
+        called.append(response.status_code)
+
+    async def run():
+        async with aiohttpx.Client(
+            transport = httpx.MockTransport(handler),
+            event_hooks = {'response': [on_response]},
+        ) as client:
+            await client.async_get('https://example.org/get')
+
+    asyncio.run(run())
+    assert called == [200]
+
+
+def test_async_overrides_take_priority():
+    async_transport = httpx.MockTransport(lambda request: httpx.Response(201))
+    params = aiohttpx.ClientParams(
+        transport = httpx.MockTransport(handler),
+        async_transport = async_transport,
+    )
+    assert params.async_kwargs['transport'] is async_transport
+    assert params.sync_kwargs['transport'] is params.transport
+    assert 'async_transport' not in params.async_kwargs
@@ -0,0 +1,60 @@
+import asyncio
+import aiohttpx
+from aiohttpx.utils import pool
+
+
+def test_shared_pool_refcount():
+    a = aiohttpx.Client(base_url = 'https://a.example', share_pool = True)
+    b = aiohttpx.Client(base_url = 'https://b.example', share_pool = True)
+    transport = a.sync_client._transport
+    assert b.sync_client._transport is transport
+    assert transport._refs == 2
+    a.close()
+    assert transport._refs == 1
+    assert transport._key in pool._shared_transports
+    b.close()
+    assert transport._key not in pool._shared_transports
+
+
+def test_unshared_pool():
+    a = aiohttpx.Client(share_pool = True)
+    b = aiohttpx.Client()
+    assert a.sync_client._transport is not b.sync_client._transport
+    a.close()
+    b.close()
+
+
+def test_async_shared_pool_per_loop():
+    async def run():
+        a = aiohttpx.Client(share_pool = True)
+        b = aiohttpx.Client(share_pool = True)
+        transport = a.async_client._transport
+        assert b.async_client._transport is transport
+        assert transport._refs == 2
+        await a.aclose()
+        assert transport._refs == 1
+        await b.aclose()
+        assert asyncio.get_running_loop() not in pool._async_shared_transports
+        return transport
+
+    async def run_open():
+        # Kept open until the other loop has created its transport
+        client = aiohttpx.Client(share_pool = True)
+        return client, client.async_client._transport
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first is not second
+
+    loop = asyncio.new_event_loop()
+    try:
+        client, transport = loop.run_until_complete(run_open())
+        assert asyncio.run(run()) is not transport
+        loop.run_until_complete(client.aclose())
+    finally:
+        loop.close()
+
+
+def test_async_pool_not_shared_outside_loop():
+    client = aiohttpx.Client(share_pool = True)
+    assert not isinstance(client.async_client._transport, pool.AsyncSharedTransport)
@@ -8,9 +8,7 @@ def sync_init_hook(client: aiohttpx.Client, **kwargs):
     Sync init hook
     """
     logger.info('sync init hook')
-    client.headers.update(
-        {'sync-header1': 'test-headers'}
-    )
+    client.headers['sync-header1'] = 'test-headers'
     return client
 
 async def async_init_hook(client: aiohttpx.Client, **kwargs):
@@ -18,9 +16,7 @@ async def async_init_hook(client: aiohttpx.Client, **kwargs):
     Async init hook
     """
     logger.info('async init hook')
-    client.headers.update(
-        {'async-header1': 'test-headers'}
-    )
+    client.headers['async-header1'] = 'test-headers'
     return client
 
 def sync_init_hook_kwargs(client: aiohttpx.Client, value: str = None, **kwargs):
@@ -28,9 +24,7 @@ def sync_init_hook_kwargs(client: aiohttpx.Client, value: str = None, **kwargs):
     Sync init hook
     """
     logger.info(f'sync init hook with value = {value}, kwargs = {kwargs}')
-    client.headers.update(
-        {'sync-header2': value}
-    )
+    client.headers['sync-header2'] = value
     return client
 
 async def async_init_hook_kwargs(client: aiohttpx.Client, value: str = None, **kwargs):
@@ -38,9 +32,7 @@ async def async_init_hook_kwargs(client: aiohttpx.Client, value: str = None, **k
     Async init hook
     """
     logger.info(f'async init hook with value = {value}, kwargs = {kwargs}')
-    client.headers.update(
-        {'async-header2': value}
-    )
+    client.headers['async-header2'] = value
     return client
 
 async def test_client():
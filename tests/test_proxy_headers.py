@@ -0,0 +1,38 @@
+import httpx
+import pytest
+import aiohttpx
+
+
+@pytest.fixture
+def client() -> aiohttpx.ProxyClient:
+    client = aiohttpx.ProxyClient(base_url = 'https://example.org')
+    client._endpoints_by_region = {None: ('gateway.example',)}
+    return client
+
+
+@pytest.mark.parametrize('headers', [
+    httpx.Headers({'X-Forwarded-For': '9.9.9.9', 'User-Agent': 'agent'}),
+    {'x-forwarded-for': '9.9.9.9', 'user-agent': 'agent'},
+    {'X-Forwarded-For': '9.9.9.9', 'User-Agent': 'agent'},
+])
+def test_forwarded_headers(client: aiohttpx.ProxyClient, headers):
+    url, proxy_headers = client._prepare_proxy_request('/path', headers)
+    assert url == 'https://gateway.example/proxy-stage/path'
+    assert proxy_headers['X-Forwarded-Header'] == '9.9.9.9'
+    assert 'X-Forwarded-For' not in proxy_headers
+    assert proxy_headers.get_list('X-User-Agent') == ['agent']
+    assert proxy_headers['X-Host'] == 'example.org'
+    # The caller's headers are not modified
+    assert len(headers) == 2
+
+
+def test_user_agent_header_not_duplicated(client: aiohttpx.ProxyClient):
+    _, proxy_headers = client._prepare_proxy_request('/path', {'x-user-agent': 'custom', 'x-host': 'other.org'})
+    assert proxy_headers.get_list('X-User-Agent') == ['custom']
+    assert proxy_headers.get_list('X-Host') == ['other.org']
+
+
+def test_default_headers(client: aiohttpx.ProxyClient):
+    _, proxy_headers = client._prepare_proxy_request('/path')
+    assert proxy_headers['X-Forwarded-Header']
+    assert 'X-User-Agent' in proxy_headers
@@ -0,0 +1,66 @@
+import time
+import threading
+from aiohttpx.imports import boto
+from aiohttpx.schemas import proxies
+from aiohttpx.schemas.proxies import ProxyManager, ProxyRegion, ProxyEndpoint
+
+
+class FakeSession:
+    """
+    Records the clients that are created
+    """
+
+    clients = []
+
+    def client(self, *args, **kwargs):
+        time.sleep(0.01)
+        client = object()
+        self.clients.append(client)
+        return client
+
+
+def test_aws_client_created_once(monkeypatch):
+    monkeypatch.setattr(FakeSession, 'clients', [])
+    monkeypatch.setattr(boto, 'BotoSession', FakeSession)
+    manager = ProxyManager(base_url = 'https://example.org')
+    threads = [threading.Thread(target = manager.get_aws_client, args = ('us-east-1',)) for _ in range(8)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    assert len(FakeSession.clients) == 1
+    assert manager.get_aws_client('us-east-1') is FakeSession.clients[0]
+
+
+class FakeDeleteClient:
+    """
+    Records the most deletes that run at once
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+        self.deleted = []
+
+    def delete_rest_api(self, restApiId):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+            self.deleted.append(restApiId)
+
+
+def test_clear_apis_bounded(monkeypatch):
+    regions = ['us-east-1', 'us-east-2']
+    manager = ProxyManager(base_url = 'https://example.org', regions_data = {
+        region: ProxyRegion(name = 'proxy', region = region, endpoints = [
+            ProxyEndpoint(name = 'proxy', api_id = f'{region}-{i}', region = region) for i in range(6)
+        ]) for region in regions
+    })
+    clients = {region: FakeDeleteClient() for region in regions}
+    monkeypatch.setattr(manager, 'get_aws_client', clients.get)
+    manager.clear_apis(force = True)
+    for region, client in clients.items():
+        assert len(client.deleted) == 6
+        assert client.max_running <= proxies._DELETE_CONCURRENCY
+        assert not manager.regions_data[region].endpoints
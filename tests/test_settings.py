@@ -0,0 +1,13 @@
+import aiohttpx
+from aiohttpx.utils.lazy import get_aiohttpx_settings
+
+
+def test_limits_follow_settings(monkeypatch):
+    settings = get_aiohttpx_settings()
+    monkeypatch.setattr(settings, 'max_connections', 7)
+    assert settings.limits.max_connections == 7
+    client = aiohttpx.Client()
+    try:
+        assert client.sync_client._transport._pool._max_connections == 7
+    finally:
+        client.close()